@@ -15,11 +15,18 @@ from dotenv import load_dotenv
 
 from src.core import Settings
 from src.application.workflow import RAGWorkflow
-from src.domain.nodes import GeneratorNode, QueryRewriteNode, RetrieverNode, SimpleGeneratorNode
+from src.domain.nodes import (
+    GeneratorNode,
+    QueryRewriteNode,
+    EmbedQueriesNode,
+    RetrieverNode,
+    SimpleGeneratorNode,
+)
 from src.domain.entities import PreprocessingResult
 from src.infrastructure import (
     LLMService,
     RerankerService,
+    BatchedReranker,
     VectorStoreService,
     CacheService,
     DatabaseService,
@@ -52,17 +59,18 @@ class RAGApplication:
     def __init__(self, settings: Settings = None):
         self.settings = settings or Settings()
 
-        # Infrastructure Layer - 외부 시스템 연결
-        self._llm_service = LLMService(self.settings)
-        self._vectorstore_service = VectorStoreService(self.settings)
-        self._reranker_service = RerankerService(self.settings)
-        self._preprocessing_pipeline = PreprocessingPipeline(self.settings)
-
         # Infrastructure Layer - 캐시, DB, 인증
         self._cache_service = CacheService(self.settings)
         self._database_service = DatabaseService(self.settings)
         self._auth_service = AuthService(self.settings)
 
+        # Infrastructure Layer - 외부 시스템 연결
+        self._llm_service = LLMService(self.settings)
+        self._vectorstore_service = VectorStoreService(self.settings, self._cache_service)
+        self._reranker_service = RerankerService(self.settings)
+        self._batched_reranker = BatchedReranker(self._reranker_service, self.settings)
+        self._preprocessing_pipeline = PreprocessingPipeline(self.settings)
+
         # Infrastructure Layer - Repositories
         self._user_repo = UserRepository(self._database_service)
         self._conversation_repo = ConversationRepository(self._database_service)
@@ -70,7 +78,10 @@ class RAGApplication:
 
         # Domain Layer (Nodes) - 비즈니스 로직
         self._query_rewrite_node = QueryRewriteNode(self._llm_service)
-        self._retriever_node = RetrieverNode(self._vectorstore_service, self._reranker_service)
+        self._embed_queries_node = EmbedQueriesNode(self._vectorstore_service)
+        self._retriever_node = RetrieverNode(
+            self._vectorstore_service, self._reranker_service, self._batched_reranker
+        )
         self._generator_node = GeneratorNode(self._llm_service)
         self._simple_generator_node = SimpleGeneratorNode(self._llm_service)
 
@@ -78,6 +89,7 @@ class RAGApplication:
         self._workflow = RAGWorkflow(
             self._llm_service,
             self._query_rewrite_node,
+            self._embed_queries_node,
             self._retriever_node,
             self._generator_node,
             self._simple_generator_node,
@@ -97,6 +109,11 @@ class RAGApplication:
 
     # ============ Properties - 새 서비스 ============
 
+    @property
+    def batched_reranker(self) -> BatchedReranker:
+        """요청 병합 Reranker (비동기 경로용)"""
+        return self._batched_reranker
+
     @property
     def cache_service(self) -> CacheService:
         """캐시 서비스 (Redis)"""
@@ -160,9 +177,27 @@ class RAGApplication:
 
         return self
 
-    def run(self, question: str) -> str:
-        """질문에 대한 답변 생성"""
-        return self._workflow.invoke(question)["final_answer"]
+    def run(self, question: str, no_cache: bool = False) -> str:
+        """질문에 대한 답변 생성
+
+        시맨틱 캐시가 활성화된 경우 질문 임베딩 유사도로 기존 답변을
+        먼저 조회하고, 히트 시 워크플로우 실행을 생략합니다.
+
+        Args:
+            question: 사용자 질문
+            no_cache: True면 시맨틱 캐시를 우회 (민감한 질문 등)
+        """
+        if no_cache or not self.settings.redis.semantic_enabled:
+            return self._workflow.invoke(question)["final_answer"]
+
+        embedding = self._vectorstore_service.embeddings.embed_query(question)
+        cached = self._cache_service.semantic_get(embedding)
+        if cached is not None:
+            return cached
+
+        answer = self._workflow.invoke(question)["final_answer"]
+        self._cache_service.semantic_put(embedding, answer)
+        return answer
 
     def ingest_file(self, file_path: str) -> PreprocessingResult:
         """파일 수집 (전처리 → 벡터 저장)"""
@@ -4,7 +4,7 @@ Workflow State
 Application Layer: 워크플로우 상태를 정의합니다.
 LangGraph의 StateGraph에서 사용됩니다.
 """
-from typing import List, TypedDict
+from typing import List, NotRequired, TypedDict
 
 
 class RAGState(TypedDict):
@@ -12,16 +12,27 @@ class RAGState(TypedDict):
 
     LangGraph StateGraph를 통해 각 노드 간에 전달되는 상태입니다.
 
+    question 외의 키는 NotRequired: 각 노드가 자신의 출력만 반환하면
+    LangGraph가 병합하므로, 실행 시작 시 모든 키를 빈 값으로 채워
+    딕셔너리를 새로 구성할 필요가 없습니다. (LLM 경로는 검색 관련
+    키를 아예 만들지 않음)
+
     Attributes:
         question: 사용자 질문
-        optimized_queries: Query Rewrite 노드 출력
+        datasource: 라우팅 결정 (vectorstore or llm)
+        optimized_queries: Route & Rewrite 노드 출력
+        query_embeddings: EmbedQueries 노드 출력 (쿼리별 Dense 벡터)
         retrieved_docs: Retriever 노드 출력
+        doc_digests: retrieved_docs와 같은 순서의 blake2b 8바이트 hex 식별자
         final_answer: Generator 노드 출력
     """
     question: str
-    optimized_queries: List[str]
-    retrieved_docs: List[str]
-    final_answer: str
+    datasource: NotRequired[str]
+    optimized_queries: NotRequired[List[str]]
+    query_embeddings: NotRequired[List[List[float]]]
+    retrieved_docs: NotRequired[List[str]]
+    doc_digests: NotRequired[List[str]]
+    final_answer: NotRequired[str]
 
 
 class QueryOutput(TypedDict):
@@ -32,6 +43,7 @@ class QueryOutput(TypedDict):
 class RetrievalOutput(TypedDict):
     """Retriever 노드 출력"""
     retrieved_docs: List[str]
+    doc_digests: List[str]
 
 
 class GenerationOutput(TypedDict):
@@ -4,20 +4,47 @@ RAG Workflow - LangGraph
 Application Layer: RAG 파이프라인의 흐름을 정의합니다.
 각 노드(Domain Layer)를 조합하여 유스케이스를 구성합니다.
 """
+import re
 import time
-from typing import Literal
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Any, Literal
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import StateGraph, END
 
 from .state import RAGState
 from src.core.logging import get_logger
-from src.domain.entities import RouteQuery
-from src.domain.nodes import QueryRewriteNode, RetrieverNode, GeneratorNode, SimpleGeneratorNode
-from src.domain.prompts import ROUTER_SYSTEM_PROMPT
+from src.domain.entities import RouteAndRewrite
+from src.domain.nodes import (
+    QueryRewriteNode,
+    EmbedQueriesNode,
+    RetrieverNode,
+    GeneratorNode,
+    SimpleGeneratorNode,
+)
+from src.domain.prompts import ROUTE_AND_REWRITE_SYSTEM_PROMPT
 from src.infrastructure import LLMService
 
 logger = get_logger(__name__)
 
+# 라우터 프롬프트는 불변이므로 import 시점에 1회만 구성
+# (요청마다 템플릿 파싱/Pydantic 검증을 반복하지 않음)
+_ROUTER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ROUTE_AND_REWRITE_SYSTEM_PROMPT),
+    ("human", "{question}")
+])
+
+# 명백한 잡담(인사/감사/맞장구) 패턴 - LLM 라우터 호출 없이 분류
+# 보수적으로 유지: 애매한 질문은 LLM 라우터로 넘어가야 함
+_CHITCHAT_PATTERNS = re.compile(
+    r"^\s*("
+    r"안녕(하세요|하십니까)?|하이|헬로|반가워(요)?"
+    r"|고마워(요)?|감사(합니다|해요)?|수고(하세요|했어요)?"
+    r"|잘\s?가(요)?|바이|응|넵?|네|오케이|ㅇㅋ|ㅋ+|ㅎ+"
+    r"|h(i|ello|ey)|thanks?( you)?|thank you|bye|ok(ay)?|good (morning|night)"
+    r")\s*[.!~^]*\s*$",
+    re.IGNORECASE,
+)
+
 
 class RAGWorkflow:
     """RAG 워크플로우
@@ -25,8 +52,8 @@ class RAGWorkflow:
     LangGraph 기반 상태 머신으로 RAG 파이프라인을 구성합니다.
 
     흐름:
-    1. Router: 질문 분석 → vectorstore or llm
-    2-a. RAG 경로: QueryRewrite → Retriever → Generator → END
+    1. RouteAndRewrite: 라우팅 결정 + 쿼리 최적화 (LLM 호출 1회로 융합)
+    2-a. RAG 경로: EmbedQueries → Retriever → Generator → END
     2-b. LLM 경로: SimpleGenerator → END
 
     왜 조건부 라우팅인가?
@@ -39,65 +66,125 @@ class RAGWorkflow:
         self,
         llm_service: LLMService,
         query_rewrite_node: QueryRewriteNode,
+        embed_queries_node: EmbedQueriesNode,
         retriever_node: RetrieverNode,
         generator_node: GeneratorNode,
         simple_generator_node: SimpleGeneratorNode,
     ):
         self._llm_service = llm_service
         self._query_rewrite_node = query_rewrite_node
+        self._embed_queries_node = embed_queries_node
         self._retriever_node = retriever_node
         self._generator_node = generator_node
         self._simple_generator_node = simple_generator_node
+        self._router_llm = llm_service.get_rewrite_llm()  # 요청마다 재해석하지 않도록 memoize
+        # 정규화된 질문 → (datasource, queries, 만료 시각) LRU+TTL 캐시
+        # 반복되는 FAQ성 질문에서 라우터 LLM 호출을 생략 (시맨틱 캐시와 달리 정확 일치)
+        # TTL로 오래된 리라이트 결과가 무한정 재사용되는 것을 방지
+        self._route_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._route_cache_maxsize = 4096
+        self._route_cache_ttl = 3600.0  # 초
+        # 라우터 체인은 build()에서 1회 구성 (스키마 바인딩 재컴파일 방지)
+        self._router_chain = None
         self._app = None
+        self._app_simple = None
 
-    def route_question(self, state: RAGState) -> Literal["query_rewrite", "simple_generator"]:
-        """질문을 분석하여 경로 결정"""
-        logger.info("[Router] 질문 분석 시작: %s", state['question'][:100])
+    def route_and_rewrite(self, state: RAGState) -> Dict[str, Any]:
+        """라우팅 결정 + 쿼리 최적화 (단일 LLM 호출)
+
+        기존에는 라우팅(Router)과 쿼리 리라이트(QueryRewrite)가 각각
+        LLM을 호출하여 순차 왕복 2회가 발생했습니다. 하나의 구조화 출력
+        호출로 융합하여 RAG 경로의 왕복을 1회로 줄입니다.
+        """
+        logger.debug("[Router] 질문 분석 시작: %s", state['question'][:100])
         start_time = time.time()
 
-        llm = self._llm_service.get_rewrite_llm()
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", ROUTER_SYSTEM_PROMPT),
-            ("human", "{question}")
-        ])
-        decision = self._llm_service.invoke_with_structured_output(
-            llm=llm, prompt=prompt, output_schema=RouteQuery, input_data={"question": state["question"]}
-        )
+        # 규칙 기반 프리필터: 명백한 잡담은 LLM 라우터 호출 없이 분류
+        if _CHITCHAT_PATTERNS.match(state["question"]):
+            logger.debug("[Router] 프리필터 매치 - 일반 대화 경로 (LLM 호출 생략)")
+            return {"datasource": "llm", "optimized_queries": [state["question"]]}
+
+        # 정확 일치 LRU+TTL 캐시 (반복 질문은 라우터 LLM 호출 생략)
+        cache_key = state["question"].strip().lower()
+        cached = self._route_cache.get(cache_key)
+        if cached is not None:
+            datasource, queries, expires_at = cached
+            if time.monotonic() < expires_at:
+                self._route_cache.move_to_end(cache_key)
+                logger.debug("[Router] 라우팅 캐시 히트 - %s 경로", datasource)
+                return {"datasource": datasource, "optimized_queries": list(queries)}
+            del self._route_cache[cache_key]  # 만료된 항목 제거
+
+        try:
+            decision: RouteAndRewrite = self._llm_service.invoke_chain(
+                self._router_chain, {"question": state["question"]}
+            )
+            datasource = decision.datasource
+            queries = decision.optimized_queries or [state["question"]]
+
+            # 성공한 결정만 캐시 (폴백 결정은 캐시하지 않음)
+            self._route_cache[cache_key] = (
+                datasource, tuple(queries), time.monotonic() + self._route_cache_ttl
+            )
+            if len(self._route_cache) > self._route_cache_maxsize:
+                self._route_cache.popitem(last=False)
+        except Exception as e:
+            logger.warning("[Router] 라우팅 실패, RAG 경로로 폴백: %s", e)
+            datasource, queries = "vectorstore", [state["question"]]
 
         elapsed_ms = (time.time() - start_time) * 1000
-        if decision.datasource == "vectorstore":
-            logger.info("[Router] RAG 검색 경로 선택 (%.1fms)", elapsed_ms)
-            return self._query_rewrite_node.name
-        else:
-            logger.info("[Router] 일반 대화 경로 선택 (%.1fms)", elapsed_ms)
-            return self._simple_generator_node.name
+        logger.debug("[Router] %s 경로 선택 (%.1fms)",
+                     "RAG 검색" if datasource == "vectorstore" else "일반 대화", elapsed_ms)
+        return {"datasource": datasource, "optimized_queries": queries}
+
+    def dispatch(self, state: RAGState) -> Literal["embed_queries", "simple_generator"]:
+        """라우팅 결정에 따라 분기 (LLM 호출 없음)"""
+        if state["datasource"] == "vectorstore":
+            return self._embed_queries_node.name
+        return self._simple_generator_node.name
 
     def build(self) -> "RAGWorkflow":
         """워크플로우 빌드"""
+        # 라우터 체인 구성: with_structured_output의 스키마→함수호출 JSON
+        # 스펙 컴파일을 요청마다 반복하지 않도록 빌드 시점에 1회만 수행
+        self._router_chain = _ROUTER_PROMPT | self._router_llm.with_structured_output(RouteAndRewrite)
+
         workflow = StateGraph(RAGState)
 
-        # 노드 추가
-        workflow.add_node(self._query_rewrite_node.name, self._query_rewrite_node)
+        # 노드 추가 (QueryRewrite는 route_and_rewrite에 융합되어 그래프에서 제외)
+        workflow.add_node("route_and_rewrite", self.route_and_rewrite)
+        workflow.add_node(self._embed_queries_node.name, self._embed_queries_node)
         workflow.add_node(self._retriever_node.name, self._retriever_node)
         workflow.add_node(self._generator_node.name, self._generator_node)
         workflow.add_node(self._simple_generator_node.name, self._simple_generator_node)
 
-        # 조건부 진입점 (라우팅)
-        workflow.set_conditional_entry_point(
-            self.route_question,
+        # 진입점 + 조건부 분기 (분기 함수는 상태만 읽음)
+        workflow.set_entry_point("route_and_rewrite")
+        workflow.add_conditional_edges(
+            "route_and_rewrite",
+            self.dispatch,
             {
-                self._query_rewrite_node.name: self._query_rewrite_node.name,
+                self._embed_queries_node.name: self._embed_queries_node.name,
                 self._simple_generator_node.name: self._simple_generator_node.name
             }
         )
 
         # 엣지 정의 (흐름)
-        workflow.add_edge(self._query_rewrite_node.name, self._retriever_node.name)
+        workflow.add_edge(self._embed_queries_node.name, self._retriever_node.name)
         workflow.add_edge(self._retriever_node.name, self._generator_node.name)
         workflow.add_edge(self._generator_node.name, END)
         workflow.add_edge(self._simple_generator_node.name, END)
 
         self._app = workflow.compile()
+
+        # 특화 그래프: 프리필터에서 잡담으로 확정된 질문 전용 (1노드)
+        # 라우터 노드와 조건부 분기 평가를 아예 거치지 않음
+        simple = StateGraph(RAGState)
+        simple.add_node(self._simple_generator_node.name, self._simple_generator_node)
+        simple.set_entry_point(self._simple_generator_node.name)
+        simple.add_edge(self._simple_generator_node.name, END)
+        self._app_simple = simple.compile()
+
         return self
 
     @property
@@ -107,19 +194,73 @@ class RAGWorkflow:
             raise RuntimeError("Workflow가 빌드되지 않았습니다. build()를 먼저 호출하세요.")
         return self._app
 
-    def invoke(self, question: str) -> dict:
-        """워크플로우 실행"""
+    def _select_app(self, question: str):
+        """질문 형태에 따라 특화 그래프를 선택
+
+        프리필터에서 잡담으로 확정되면 라우터/분기 없는 1노드 그래프를
+        사용합니다. 프리필터는 라우터 노드에도 남아 있어 이 특화는
+        순수한 바이패스입니다.
+        """
+        if self._app_simple is not None and _CHITCHAT_PATTERNS.match(question):
+            logger.debug("[Workflow] 프리필터 매치 - 특화 그래프(simple) 사용")
+            return self._app_simple
+        return self.app
+
+    def invoke(self, question: str, config: dict = None) -> dict:
+        """워크플로우 실행
+
+        Args:
+            question: 사용자 질문
+            config: LangGraph RunnableConfig (예: {"callbacks": [...]})
+        """
         logger.info("[Workflow] 실행 시작")
         start_time = time.time()
 
-        result = self.app.invoke({
-            "question": question,
-            "optimized_queries": [],
-            "retrieved_docs": [],
-            "final_answer": ""
-        })
+        # question 외 키는 NotRequired이므로 최소 상태로 시작
+        # (각 노드의 출력이 LangGraph 병합으로 채워짐)
+        result = self._select_app(question).invoke({"question": question}, config=config)
 
         elapsed_ms = (time.time() - start_time) * 1000
         logger.info("[Workflow] 실행 완료 (%.1fms) - 검색 문서: %d개",
                    elapsed_ms, len(result.get("retrieved_docs", [])))
         return result
+
+    async def ainvoke(self, question: str, config: dict = None) -> dict:
+        """워크플로우 비동기 실행
+
+        동기 invoke는 이벤트 루프의 스레드풀 워커 하나를 수 초간 점유하므로,
+        API 경로에서는 이쪽을 await하여 이벤트 루프를 막지 않습니다.
+        """
+        logger.info("[Workflow] 비동기 실행 시작")
+        start_time = time.time()
+
+        result = await self._select_app(question).ainvoke({"question": question}, config=config)
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.info("[Workflow] 비동기 실행 완료 (%.1fms) - 검색 문서: %d개",
+                   elapsed_ms, len(result.get("retrieved_docs", [])))
+        return result
+
+    async def astream(self, question: str) -> AsyncIterator[str]:
+        """워크플로우 실행 (토큰 스트리밍)
+
+        생성 LLM의 토큰을 생성되는 즉시 yield합니다.
+        전체 연산량은 동일하지만 첫 토큰까지의 체감 지연(TTFT)을 줄입니다.
+        """
+        logger.info("[Workflow] 스트리밍 실행 시작")
+
+        async for event in self._select_app(question).astream_events(
+            {"question": question},
+            version="v2",
+        ):
+            # 생성 노드의 토큰만 전달 (라우터의 구조화 출력 토큰은 제외)
+            if event["event"] != "on_chat_model_stream":
+                continue
+            node = event.get("metadata", {}).get("langgraph_node", "")
+            if node not in (self._generator_node.name, self._simple_generator_node.name):
+                continue
+            content = event["data"]["chunk"].content
+            if content:
+                yield content
+
+        logger.info("[Workflow] 스트리밍 실행 완료")
@@ -18,6 +18,9 @@ class LLMSettings:
     generator_model: str = "gpt-4o"
     generator_temperature: float = 0.0
 
+    # 동시 LLM 호출 상한 (429 백오프 재시도로 인한 p99 악화 방지)
+    max_concurrency: int = 10
+
 
 @dataclass
 class EmbeddingSettings:
@@ -44,12 +47,16 @@ class RerankerSettings:
     base_url: str = "http://localhost:8002"
     model_name: str = "BAAI/bge-reranker-v2-m3"
     top_k: int = 5
+    coalesce_window_ms: float = 8.0  # 동시 요청 병합 대기 시간
 
 
 @dataclass
 class RetrieverSettings:
     """Retriever Settings"""
     initial_limit: int = 30
+    max_workers: int = 4  # 멀티 쿼리 병렬 검색 스레드 상한
+    fanout_budget_ms: float = 0.0  # 병렬 검색 전체 대기 예산 (0 = 무제한)
+    max_content_chars: int = 0  # 검색 결과 content 길이 상한 (0 = 자르지 않음)
 
 
 @dataclass
@@ -75,6 +82,12 @@ class RedisSettings:
     db: int = 0
     ttl: int = 3600  # 캐시 TTL (초)
 
+    # 시맨틱 쿼리 캐시 (질문 임베딩 유사도 기반)
+    semantic_enabled: bool = False
+    semantic_threshold: float = 0.95  # 코사인 유사도 임계값
+    semantic_ttl: int = 86400  # 24시간
+    semantic_max_entries: int = 1000  # LRU 퇴출 상한
+
 
 @dataclass
 class DatabaseSettings:
@@ -84,6 +97,9 @@ class DatabaseSettings:
     user: str = "postgres"
     password: str = "password"
     database: str = "rag_db"
+    pool_size: int = 20  # 상시 유지 커넥션 수
+    max_overflow: int = 40  # 버스트 시 추가 허용 커넥션 수
+    pool_recycle: int = 300  # 커넥션 재생성 주기 (초, 유휴 끊김 방지)
 
     @property
     def url(self) -> str:
@@ -97,6 +113,25 @@ class JWTSettings:
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     expire_minutes: int = 60 * 24  # 24시간
+    bcrypt_rounds: int = 12  # 비밀번호 해시 비용 (2^n 회 반복)
+
+
+# 환경변수 오버라이드 테이블: (환경변수, 설정 그룹, 필드, 변환 함수)
+# 선언적 테이블로 관리하여 env 조회를 항목당 1회로 줄이고 추가를 쉽게 함
+_ENV_MAP = (
+    ("QDRANT_HOST", "vectorstore", "host", str),
+    ("QDRANT_PORT", "vectorstore", "port", int),
+    ("QDRANT_GRPC_PORT", "vectorstore", "grpc_port", int),
+    ("RERANKER_BASE_URL", "reranker", "base_url", str),
+    ("REDIS_HOST", "redis", "host", str),
+    ("REDIS_PORT", "redis", "port", int),
+    ("DATABASE_HOST", "database", "host", str),
+    ("DATABASE_PORT", "database", "port", int),
+    ("DATABASE_USER", "database", "user", str),
+    ("DATABASE_PASSWORD", "database", "password", str),
+    ("DATABASE_NAME", "database", "database", str),
+    ("JWT_SECRET_KEY", "jwt", "secret_key", str),
+)
 
 
 @dataclass
@@ -113,39 +148,11 @@ class Settings:
     jwt: JWTSettings = field(default_factory=JWTSettings)
 
     def __post_init__(self):
-        # 환경변수 오버라이드 - Qdrant
-        if os.getenv("QDRANT_HOST"):
-            self.vectorstore.host = os.getenv("QDRANT_HOST")
-        if os.getenv("QDRANT_PORT"):
-            self.vectorstore.port = int(os.getenv("QDRANT_PORT"))
-        if os.getenv("QDRANT_GRPC_PORT"):
-            self.vectorstore.grpc_port = int(os.getenv("QDRANT_GRPC_PORT"))
-
-        # 환경변수 오버라이드 - Reranker
-        if os.getenv("RERANKER_BASE_URL"):
-            self.reranker.base_url = os.getenv("RERANKER_BASE_URL")
-
-        # 환경변수 오버라이드 - Redis
-        if os.getenv("REDIS_HOST"):
-            self.redis.host = os.getenv("REDIS_HOST")
-        if os.getenv("REDIS_PORT"):
-            self.redis.port = int(os.getenv("REDIS_PORT"))
-
-        # 환경변수 오버라이드 - Database
-        if os.getenv("DATABASE_HOST"):
-            self.database.host = os.getenv("DATABASE_HOST")
-        if os.getenv("DATABASE_PORT"):
-            self.database.port = int(os.getenv("DATABASE_PORT"))
-        if os.getenv("DATABASE_USER"):
-            self.database.user = os.getenv("DATABASE_USER")
-        if os.getenv("DATABASE_PASSWORD"):
-            self.database.password = os.getenv("DATABASE_PASSWORD")
-        if os.getenv("DATABASE_NAME"):
-            self.database.database = os.getenv("DATABASE_NAME")
-
-        # 환경변수 오버라이드 - JWT
-        if os.getenv("JWT_SECRET_KEY"):
-            self.jwt.secret_key = os.getenv("JWT_SECRET_KEY")
+        # 환경변수 오버라이드 (테이블 기반, env 조회 항목당 1회)
+        for env_name, group, attr, cast in _ENV_MAP:
+            value = os.getenv(env_name)
+            if value:
+                setattr(getattr(self, group), attr, cast(value))
 
 
 settings = Settings()
@@ -7,6 +7,19 @@ import logging
 import sys
 from typing import Optional
 
+# 로깅이 설정되었는지 여부 (첫 get_logger 호출 시 1회만 초기화)
+_initialized = False
+
+# 레벨을 낮출 외부 라이브러리 로거 목록
+_NOISY_LOGGERS = (
+    "httpx",
+    "httpcore",
+    "urllib3",
+    "openai",
+    "qdrant_client",
+    "langchain",
+)
+
 
 def setup_logging(
     level: int = logging.DEBUG,
@@ -21,11 +34,16 @@ def setup_logging(
         log_format: 로그 포맷 (기본: 상세 포맷)
         log_file: 로그 파일 경로 (선택사항)
     """
+    global _initialized
+
     if log_format is None:
         log_format = (
             "%(asctime)s | %(levelname)-8s | %(name)-30s | %(message)s"
         )
 
+    # 핸들러 간 공유 포맷터 (동일 설정을 중복 생성하지 않음)
+    formatter = logging.Formatter(log_format)
+
     # 루트 로거 설정
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -36,23 +54,21 @@ def setup_logging(
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
     # 파일 핸들러 (선택사항)
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(level)
-        file_handler.setFormatter(logging.Formatter(log_format))
+        file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
 
     # 외부 라이브러리 로깅 레벨 조정
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("qdrant_client").setLevel(logging.WARNING)
-    logging.getLogger("langchain").setLevel(logging.WARNING)
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    _initialized = True
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -70,8 +86,8 @@ def get_logger(name: str) -> logging.Logger:
         logger.info("Processing started")
         logger.debug("Details: %s", data)
     """
+    # 지연 초기화: import 시점이 아니라 로거가 실제로 필요한 첫 호출에서 설정
+    # (callers가 setup_logging을 직접 호출한 경우 중복 설정하지 않음)
+    if not _initialized:
+        setup_logging()
     return logging.getLogger(name)
-
-
-# 기본 로깅 초기화 (import 시 자동 실행)
-setup_logging()
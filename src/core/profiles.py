@@ -9,11 +9,27 @@ RAG 파이프라인의 다양한 설정 조합을 정의하는 실험 프로파
 - 포트폴리오: "hybrid_rerank vs baseline" 비교 결과 시각화
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Literal
+from enum import Enum
+from types import MappingProxyType
+from typing import Dict, Literal, Mapping, Union
 
 
-@dataclass
+class ProfileID(str, Enum):
+    """실험 프로파일 식별자
+
+    str 서브클래스이므로 기존 문자열 ID("baseline" 등)와 그대로
+    비교/해시되며, Enum 멤버로 조회하면 재해싱 없이 O(1) 조회됩니다.
+    """
+    BASELINE = "baseline"
+    HYBRID_V1 = "hybrid_v1"
+    HYBRID_REWRITE = "hybrid_rewrite"
+    HYBRID_RERANK = "hybrid_rerank"
+    FAST = "fast"
+
+
+@dataclass(frozen=True, slots=True)
 class ExperimentProfile:
     """실험 프로파일 정의"""
 
@@ -39,18 +55,20 @@ class ExperimentProfile:
     generator_temperature: float = 0.0
 
     def __post_init__(self):
-        """유효성 검사"""
+        """유효성 검사 및 ID 인터닝"""
         if self.rerank_top_k > self.initial_retrieval_limit:
             raise ValueError(
                 f"rerank_top_k ({self.rerank_top_k}) cannot exceed "
                 f"initial_retrieval_limit ({self.initial_retrieval_limit})"
             )
+        # ID는 dict 키로 자주 쓰이므로 인터닝 (frozen이라 object.__setattr__ 사용)
+        object.__setattr__(self, "id", sys.intern(self.id))
 
 
-# 사전 정의된 프로파일들
-PROFILES: Dict[str, ExperimentProfile] = {
+# 사전 정의된 프로파일들 (런타임 불변 - 하단에서 MappingProxyType으로 동결)
+PROFILES: Mapping[ProfileID, ExperimentProfile] = {
     # Baseline: Dense Search만 사용, Reranker/Query Rewrite 없음
-    "baseline": ExperimentProfile(
+    ProfileID.BASELINE: ExperimentProfile(
         id="baseline",
         name="Baseline (Dense Only)",
         description="Dense embedding만 사용. Reranker와 Query Rewrite 미적용.",
@@ -63,7 +81,7 @@ PROFILES: Dict[str, ExperimentProfile] = {
     ),
 
     # Hybrid: Dense + Sparse, Reranker 없음
-    "hybrid_v1": ExperimentProfile(
+    ProfileID.HYBRID_V1: ExperimentProfile(
         id="hybrid_v1",
         name="Hybrid Search",
         description="Dense + BM25 Hybrid Search. Reranker 미적용.",
@@ -76,7 +94,7 @@ PROFILES: Dict[str, ExperimentProfile] = {
     ),
 
     # Hybrid + Query Rewrite
-    "hybrid_rewrite": ExperimentProfile(
+    ProfileID.HYBRID_REWRITE: ExperimentProfile(
         id="hybrid_rewrite",
         name="Hybrid + Query Rewrite",
         description="Hybrid Search + 쿼리 확장. Reranker 미적용.",
@@ -89,7 +107,7 @@ PROFILES: Dict[str, ExperimentProfile] = {
     ),
 
     # Full Pipeline: 모든 기능 활성화 (현재 기본값)
-    "hybrid_rerank": ExperimentProfile(
+    ProfileID.HYBRID_RERANK: ExperimentProfile(
         id="hybrid_rerank",
         name="Full Pipeline (Hybrid + Rerank)",
         description="Hybrid Search + Query Rewrite + Cross-Encoder Reranking. 최고 품질.",
@@ -102,7 +120,7 @@ PROFILES: Dict[str, ExperimentProfile] = {
     ),
 
     # Fast: 빠른 응답 우선 (정확도 희생)
-    "fast": ExperimentProfile(
+    ProfileID.FAST: ExperimentProfile(
         id="fast",
         name="Fast Mode",
         description="빠른 응답 우선. Reranker 미적용, 적은 후보.",
@@ -116,8 +134,28 @@ PROFILES: Dict[str, ExperimentProfile] = {
     ),
 }
 
+# 프로파일은 런타임에 변하지 않으므로 읽기 전용 뷰로 동결하고,
+# 요약/에러 메시지는 import 시점에 1회만 계산
+PROFILES = MappingProxyType(PROFILES)
+
+_PROFILE_NAMES_STR = ", ".join(pid.value for pid in PROFILES)
+
+_SUMMARY_BY_ID: Dict[str, dict] = {
+    profile.id: {
+        "id": profile.id,
+        "name": profile.name,
+        "description": profile.description,
+        "retriever_type": profile.retriever_type,
+        "use_reranker": profile.use_reranker,
+        "use_query_rewrite": profile.use_query_rewrite,
+    }
+    for profile in PROFILES.values()
+}
+
+_PROFILE_SUMMARIES = list(_SUMMARY_BY_ID.values())
 
-def get_profile(profile_id: str) -> ExperimentProfile:
+
+def get_profile(profile_id: Union[str, ProfileID]) -> ExperimentProfile:
     """
     프로파일 ID로 프로파일 조회
 
@@ -130,15 +168,16 @@ def get_profile(profile_id: str) -> ExperimentProfile:
     Raises:
         ValueError: 존재하지 않는 프로파일 ID
     """
-    if profile_id not in PROFILES:
-        available = ", ".join(PROFILES.keys())
+    try:
+        pid = ProfileID(profile_id)
+    except ValueError:
         raise ValueError(
-            f"Unknown profile: '{profile_id}'. Available profiles: {available}"
-        )
-    return PROFILES[profile_id]
+            f"Unknown profile: '{profile_id}'. Available profiles: {_PROFILE_NAMES_STR}"
+        ) from None
+    return PROFILES[pid]
 
 
-def list_profiles() -> Dict[str, ExperimentProfile]:
+def list_profiles() -> Dict[ProfileID, ExperimentProfile]:
     """
     모든 프로파일 목록 반환
 
@@ -158,15 +197,12 @@ def get_profile_summary(profile_id: str) -> dict:
     Returns:
         프로파일 요약 딕셔너리
     """
-    profile = get_profile(profile_id)
-    return {
-        "id": profile.id,
-        "name": profile.name,
-        "description": profile.description,
-        "retriever_type": profile.retriever_type,
-        "use_reranker": profile.use_reranker,
-        "use_query_rewrite": profile.use_query_rewrite,
-    }
+    summary = _SUMMARY_BY_ID.get(profile_id)
+    if summary is None:
+        raise ValueError(
+            f"Unknown profile: '{profile_id}'. Available profiles: {_PROFILE_NAMES_STR}"
+        )
+    return summary
 
 
 def list_profile_summaries() -> list:
@@ -176,4 +212,4 @@ def list_profile_summaries() -> list:
     Returns:
         프로파일 요약 리스트
     """
-    return [get_profile_summary(pid) for pid in PROFILES]
+    return list(_PROFILE_SUMMARIES)
@@ -11,13 +11,13 @@ Domain Entities
 """
 from .chunk import Chunk, ChunkMetadata
 from .document import RawDocument, DocumentMetadata, PreprocessingResult
-from .models import RewriteResult, RouteQuery
+from .models import RewriteResult, RouteQuery, RouteAndRewrite
 from .user import User
 from .conversation import Conversation, Document
 
 __all__ = [
     "Chunk", "ChunkMetadata",
     "RawDocument", "DocumentMetadata", "PreprocessingResult",
-    "RewriteResult", "RouteQuery",
+    "RewriteResult", "RouteQuery", "RouteAndRewrite",
     "User", "Conversation", "Document",
 ]
@@ -6,12 +6,12 @@ Chunk Entity
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """문서 청크
 
@@ -42,27 +42,44 @@ class Chunk:
         """문자 수"""
         return len(self.content)
 
-    def to_qdrant_payload(self) -> Dict[str, Any]:
-        """Qdrant 저장용 payload로 변환"""
+    def to_qdrant_payload(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """Qdrant 저장용 payload로 변환
+
+        Args:
+            now_iso: 미리 계산된 저장 시각 (배치 저장 시 청크마다
+                datetime.now()를 다시 포맷하지 않도록 함)
+        """
+        metadata = self.metadata
         return {
             "content": self.content,
             "chunk_id": self.chunk_id,
             "doc_id": self.doc_id,
             "chunk_index": self.chunk_index,
-            "total_chunks": self.metadata.get("total_chunks", 1),
+            "total_chunks": metadata.get("total_chunks", 1),
             "source": self.source,
             "file_name": self.file_name,
             "file_type": self.file_type,
             "char_count": self.char_count,
-            "page_number": self.metadata.get("page_number"),
-            "sheet_name": self.metadata.get("sheet_name"),
-            "created_at": datetime.now().isoformat(),
+            "page_number": metadata.get("page_number"),
+            "sheet_name": metadata.get("sheet_name"),
+            "created_at": now_iso if now_iso is not None else datetime.now().isoformat(),
         }
 
+    @staticmethod
+    def batch_to_qdrant_payloads(chunks: List["Chunk"]) -> List[Dict[str, Any]]:
+        """여러 청크를 payload로 일괄 변환 (저장 시각은 1회만 계산)"""
+        now_iso = datetime.now().isoformat()
+        return [chunk.to_qdrant_payload(now_iso) for chunk in chunks]
+
 
 class ChunkMetadata(BaseModel):
-    """청크 메타데이터 (API 응답용)"""
-    model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat()})
+    """청크 메타데이터 (API 응답용)
+
+    Pydantic v2의 네이티브 직렬화는 datetime을 ISO 8601로 출력하므로
+    커스텀 json_encoders(deprecated, 직렬화마다 Python 콜백 호출)가
+    필요 없습니다. frozen으로 해시 가능 + 실수로 인한 변형 방지.
+    """
+    model_config = ConfigDict(frozen=True)
 
     chunk_id: str
     doc_id: str
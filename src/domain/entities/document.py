@@ -43,8 +43,12 @@ class RawDocument:
 
 
 class DocumentMetadata(BaseModel):
-    """문서 메타데이터 (API 응답용)"""
-    model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat()})
+    """문서 메타데이터 (API 응답용)
+
+    datetime 직렬화는 Pydantic v2 네이티브 경로(ISO 8601)를 사용합니다.
+    json_encoders는 deprecated이며 필드마다 Python 콜백을 거칩니다.
+    """
+    model_config = ConfigDict(frozen=True)
 
     doc_id: str
     source: str
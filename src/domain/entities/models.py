@@ -19,6 +19,21 @@ class RouteQuery(BaseModel):
     )
 
 
+class RouteAndRewrite(BaseModel):
+    """라우팅 + 쿼리 리라이트 융합 스키마
+
+    한 번의 구조화 출력 호출로 라우팅 결정과 검색 쿼리 최적화를
+    동시에 수행합니다. (LLM 왕복 1회 절감)
+    """
+    datasource: Literal["vectorstore", "llm"] = Field(
+        ..., description="외부 정보 검색이 필요하면 'vectorstore', 단순 대화나 일반 상식은 'llm'"
+    )
+    optimized_queries: List[str] = Field(
+        default_factory=list,
+        description="datasource가 'vectorstore'일 때, 검색 엔진에 최적화된 3~5개의 재작성 쿼리 리스트"
+    )
+
+
 class RewriteResult(BaseModel):
     """쿼리 리라이트 결과 스키마
 
@@ -6,8 +6,16 @@ RAG 파이프라인의 비즈니스 로직을 담당하는 노드들입니다.
 """
 from .base import BaseNode
 from .query_rewrite import QueryRewriteNode
+from .embed_queries import EmbedQueriesNode
 from .retriever import RetrieverNode
 from .generator import GeneratorNode
 from .simple_generator import SimpleGeneratorNode
 
-__all__ = ["BaseNode", "QueryRewriteNode", "RetrieverNode", "GeneratorNode", "SimpleGeneratorNode"]
+__all__ = [
+    "BaseNode",
+    "QueryRewriteNode",
+    "EmbedQueriesNode",
+    "RetrieverNode",
+    "GeneratorNode",
+    "SimpleGeneratorNode",
+]
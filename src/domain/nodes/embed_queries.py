@@ -0,0 +1,44 @@
+"""
+Embed Queries Node
+
+Domain Layer: 최적화된 쿼리들을 한 번의 API 호출로 일괄 임베딩합니다.
+"""
+from typing import Dict, Any
+
+from .base import BaseNode
+from src.application.state import RAGState
+from src.core.logging import get_logger
+from src.infrastructure import VectorStoreService
+
+logger = get_logger(__name__)
+
+
+class EmbedQueriesNode(BaseNode):
+    """쿼리 일괄 임베딩 노드
+
+    왜 필요한가?
+    - Retriever가 쿼리마다 임베딩 API를 호출하면 N번의 HTTP 왕복 발생
+    - OpenAI 임베딩 엔드포인트는 요청당 최대 2048개 입력을 받으므로
+      쿼리 5개를 한 번에 임베딩하여 왕복을 1회로 축소
+    """
+
+    def __init__(self, vectorstore_service: VectorStoreService):
+        self._vectorstore = vectorstore_service
+
+    @property
+    def name(self) -> str:
+        return "embed_queries"
+
+    def __call__(self, state: RAGState) -> Dict[str, Any]:
+        queries = state.get("optimized_queries", [state["question"]])
+        if not queries:
+            return {"query_embeddings": []}
+
+        logger.debug("[EmbedQueries] %d개 쿼리 일괄 임베딩", len(queries))
+        try:
+            vectors = self._vectorstore.embeddings.embed_documents(queries)
+        except Exception as e:
+            # 임베딩 실패 시 Retriever가 쿼리별로 직접 임베딩하도록 폴백
+            logger.warning("[EmbedQueries] 일괄 임베딩 실패, 개별 임베딩으로 폴백: %s", e)
+            vectors = []
+        return {"query_embeddings": vectors}
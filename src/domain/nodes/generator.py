@@ -4,13 +4,16 @@ Generator Node
 Domain Layer: 검색된 문서를 바탕으로 답변을 생성합니다.
 """
 from typing import Dict, Any, List
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import HumanMessage, SystemMessage
 
 from .base import BaseNode
 from src.application.state import RAGState
+from src.core.logging import get_logger
 from src.domain.prompts import GENERATOR_SYSTEM_PROMPT, GENERATOR_HUMAN_PROMPT
 from src.infrastructure import LLMService
 
+logger = get_logger(__name__)
+
 
 class GeneratorNode(BaseNode):
     """답변 생성 노드
@@ -22,29 +25,37 @@ class GeneratorNode(BaseNode):
 
     def __init__(self, llm_service: LLMService):
         self._llm_service = llm_service
-        self._prompt = ChatPromptTemplate.from_messages([
-            ("system", GENERATOR_SYSTEM_PROMPT),
-            ("human", GENERATOR_HUMAN_PROMPT)
-        ])
+        # 시스템 프롬프트는 변수가 없으므로 메시지 객체를 init에서 1회 생성
+        # (요청마다 LangChain 템플릿 엔진의 변수 파싱을 반복하지 않음)
+        self._system_message = SystemMessage(content=GENERATOR_SYSTEM_PROMPT)
 
     @property
     def name(self) -> str:
         return "generator"
 
     def _format_docs(self, docs: List[str]) -> str:
-        """문서를 포맷팅 ([1], [2], ... 형식)"""
-        return "\n\n".join(f"[{i+1}] {doc}" for i, doc in enumerate(docs))
+        """문서를 포맷팅 ([1], [2], ... 형식)
+
+        리스트 컴프리헨션 사용: join은 길이를 모르는 제너레이터를 받으면
+        내부적으로 리스트로 변환하므로, 직접 리스트를 만들어 제너레이터
+        프레임 왕복을 생략합니다.
+        """
+        return "\n\n".join([f"[{i + 1}] {doc}" for i, doc in enumerate(docs)])
 
     def __call__(self, state: RAGState) -> Dict[str, Any]:
-        print("--- [Step 3] Generator 시작 ---")
+        logger.debug("[Generator] 답변 생성 시작")
         docs = state.get("retrieved_docs", [])
         if not docs:
             return {"final_answer": "검색된 문서가 없어 답변을 생성할 수 없습니다."}
 
         llm = self._llm_service.get_generator_llm()
-        response = self._llm_service.invoke_with_string_output(
-            llm=llm, prompt=self._prompt,
-            input_data={"question": state["question"], "context": self._format_docs(docs)}
-        )
-        print(f"--- 생성 완료: {response[:50]}... ---")
+        # 휴먼 메시지는 str.format 치환만 수행 (템플릿 엔진 경유 없음)
+        messages = [
+            self._system_message,
+            HumanMessage(content=GENERATOR_HUMAN_PROMPT.format(
+                question=state["question"], context=self._format_docs(docs)
+            )),
+        ]
+        response = self._llm_service.invoke_with_string_output(llm=llm, prompt=messages)
+        logger.debug("[Generator] 생성 완료: %.50s...", response)
         return {"final_answer": response}
@@ -8,10 +8,13 @@ from langchain_core.prompts import ChatPromptTemplate
 
 from .base import BaseNode
 from src.application.state import RAGState
+from src.core.logging import get_logger
 from src.domain.entities import RewriteResult
 from src.domain.prompts import QUERY_REWRITE_SYSTEM_PROMPT
 from src.infrastructure import LLMService
 
+logger = get_logger(__name__)
+
 
 class QueryRewriteNode(BaseNode):
     """쿼리 리라이트 노드
@@ -34,14 +37,15 @@ class QueryRewriteNode(BaseNode):
         return "query_rewrite"
 
     def __call__(self, state: RAGState) -> Dict[str, Any]:
-        print(f"--- [Step 1] Query Rewrite 시작: {state['question']} ---")
+        # logger.debug + % 지연 포매팅: DEBUG 미만 레벨에서는 포맷 비용 자체가 없음
+        logger.debug("[QueryRewrite] 시작: %s", state["question"])
         llm = self._llm_service.get_rewrite_llm()
         try:
             result: RewriteResult = self._llm_service.invoke_with_structured_output(
                 llm=llm, prompt=self._prompt, output_schema=RewriteResult, input_data={"question": state["question"]}
             )
-            print(f"--- 생성된 쿼리: {result.queries} ---")
+            logger.debug("[QueryRewrite] 생성된 쿼리: %s", result.queries)
             return {"optimized_queries": result.queries}
         except Exception as e:
-            print(f"Error in Query Rewrite: {e}")
+            logger.warning("[QueryRewrite] 실패, 원본 질문으로 폴백: %s", e)
             return {"optimized_queries": [state["question"]]}
@@ -3,11 +3,18 @@ Retriever Node
 
 Domain Layer: Hybrid Search + Reranking으로 관련 문서를 검색합니다.
 """
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import Any, Dict, Optional
 
 from .base import BaseNode
 from src.application.state import RAGState
-from src.infrastructure import VectorStoreService, RerankerService
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.infrastructure import BatchedReranker, RerankerService, VectorStoreService
+from src.infrastructure.reranker_service import content_digest
+
+logger = get_logger(__name__)
 
 
 class RetrieverNode(BaseNode):
@@ -23,36 +30,104 @@ class RetrieverNode(BaseNode):
     - 조합: 후보를 빠르게 찾고, 정밀하게 재정렬
     """
 
-    def __init__(self, vectorstore_service: VectorStoreService, reranker_service: RerankerService):
+    def __init__(
+        self,
+        vectorstore_service: VectorStoreService,
+        reranker_service: RerankerService,
+        batched_reranker: Optional[BatchedReranker] = None,
+    ):
         self._vectorstore = vectorstore_service
         self._reranker = reranker_service
+        # 주입 시 병합 브리지 경유: 서버 환경에서 동시 요청의 리랭킹
+        # 호출이 coalesce됨 (루프 미바인딩 시 내부에서 직접 호출로 폴백)
+        self._batched = batched_reranker
 
     @property
     def name(self) -> str:
         return "retriever"
 
     def __call__(self, state: RAGState) -> Dict[str, Any]:
-        print("--- [Step 2] Retriever 시작 ---")
+        logger.debug("[Retriever] 검색 시작")
         queries = state.get("optimized_queries", [state["question"]])
-        all_results, seen = [], set()
 
-        # 각 쿼리로 Hybrid Search
-        for query in queries:
-            print(f"    검색 쿼리: {query}")
-            for content in self._vectorstore.hybrid_search(query):
-                if content not in seen:
-                    seen.add(content)
-                    all_results.append(content)
+        # EmbedQueries 노드가 일괄 임베딩한 벡터 (없거나 불일치 시 개별 임베딩)
+        embeddings = state.get("query_embeddings") or []
+        if len(embeddings) != len(queries):
+            embeddings = [None] * len(queries)
+
+        # 각 쿼리로 Hybrid Search (I/O 대기가 대부분이므로 스레드로 병렬화)
+        per_query_results = self._search_all(queries, embeddings)
+
+        # Point ID 기준 중복 제거: dict 생성자가 C 레벨 단일 패스로 처리
+        # (같은 ID의 content는 동일하므로 덮어쓰기 의미론과 setdefault가 동치,
+        #  키 삽입 순서는 첫 등장 기준으로 유지됨)
+        merged = dict(chain.from_iterable(per_query_results))
+        all_results = list(merged.values())
 
-        print(f"--- 1차 검색: {len(all_results)}개 ---")
+        logger.debug("[Retriever] 1차 검색: %d개", len(all_results))
+
+        # 문서 다이제스트는 여기서 1회만 계산하고 하위 단계가 재사용
+        # (리랭커 캐시 키, 로깅용 짧은 식별자 등)
+        digests = [content_digest(doc) for doc in all_results]
+        digest_by_doc = dict(zip(all_results, digests))
 
         # Reranking
-        ranked = self._reranker.get_top_documents(state["question"], all_results)
-        print(f"--- Reranking 후: {len(ranked)}개 ---")
+        if self._batched is not None:
+            ranked = self._batched.rerank_sync(
+                state["question"], all_results, digests=digests
+            )
+        else:
+            ranked = self._reranker.get_top_documents(
+                state["question"], all_results, digests=digests
+            )
+        logger.debug("[Retriever] Reranking 후: %d개", len(ranked))
 
         final_docs = []
+        final_digests = []
         for idx, (doc, score) in enumerate(ranked):
-            print(f"[{idx+1}등] Score: {score:.4f}")
+            doc_digest = digest_by_doc.get(doc) or content_digest(doc)
+            logger.debug("[Retriever] %d등 Score: %.4f (doc=%s)",
+                         idx + 1, score, doc_digest.hex())
             final_docs.append(doc)
+            final_digests.append(doc_digest.hex())
+
+        return {"retrieved_docs": final_docs, "doc_digests": final_digests}
+
+    def _search_all(self, queries, embeddings):
+        """쿼리별 Hybrid Search를 병렬 실행하고 쿼리 순서대로 결과를 반환합니다."""
+        for query in queries:
+            logger.debug("[Retriever] 검색 쿼리: %s", query)
+
+        def search_one(pair):
+            query, vector = pair
+            return self._vectorstore.hybrid_search_with_ids(query, query_vector=vector)
+
+        pairs = list(zip(queries, embeddings))
+
+        if len(queries) <= 1:
+            return [search_one(pair) for pair in pairs]
+
+        max_workers = min(len(queries), settings.retriever.max_workers)
+        budget_ms = settings.retriever.fanout_budget_ms
+
+        if budget_ms <= 0:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(search_one, pairs))
 
-        return {"retrieved_docs": final_docs}
+        # 예산 내 도착한 결과만 사용: 느린 서브 쿼리 하나가
+        # 전체 검색 단계를 지연시키지 않도록 함 (tail latency 방지)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [executor.submit(search_one, pair) for pair in pairs]
+        results = []
+        try:
+            for future in as_completed(futures, timeout=budget_ms / 1000):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.warning("[Retriever] 검색 실패 (무시): %s", e)
+        except TimeoutError:
+            logger.warning("[Retriever] 검색 예산 초과 (%.0fms): %d/%d개 쿼리 결과로 진행",
+                           budget_ms, len(results), len(queries))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
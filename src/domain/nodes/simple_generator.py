@@ -4,12 +4,15 @@ Simple Generator Node
 Domain Layer: RAG 검색 없이 직접 답변을 생성합니다.
 """
 from typing import Dict, Any
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import HumanMessage, SystemMessage
 
 from .base import BaseNode
 from src.application.state import RAGState
+from src.core.logging import get_logger
 from src.infrastructure import LLMService
 
+logger = get_logger(__name__)
+
 
 class SimpleGeneratorNode(BaseNode):
     """간단한 답변 생성 노드
@@ -25,19 +28,19 @@ class SimpleGeneratorNode(BaseNode):
 
     def __init__(self, llm_service: LLMService):
         self._llm_service = llm_service
-        self._prompt = ChatPromptTemplate.from_messages([
-            ("system", "당신은 유능한 AI 어시스턴트입니다. 사용자의 질문에 친절하고 정확하게 답변하세요."),
-            ("human", "{question}"),
-        ])
+        # 시스템 프롬프트는 완전히 정적이므로 메시지 객체를 init에서 1회 생성
+        self._system_message = SystemMessage(
+            content="당신은 유능한 AI 어시스턴트입니다. 사용자의 질문에 친절하고 정확하게 답변하세요."
+        )
 
     @property
     def name(self) -> str:
         return "simple_generator"
 
     def __call__(self, state: RAGState) -> Dict[str, Any]:
-        print("--- [Route: LLM] 검색 없이 즉시 답변 생성 ---")
+        logger.debug("[SimpleGenerator] 검색 없이 즉시 답변 생성")
         llm = self._llm_service.get_generator_llm()
-        answer = self._llm_service.invoke_with_string_output(
-            llm=llm, prompt=self._prompt, input_data={"question": state["question"]}
-        )
+        # 질문은 그대로 휴먼 메시지가 되므로 템플릿 치환 자체가 불필요
+        messages = [self._system_message, HumanMessage(content=state["question"])]
+        answer = self._llm_service.invoke_with_string_output(llm=llm, prompt=messages)
         return {"final_answer": answer}
@@ -9,6 +9,7 @@ from .templates import (
     GENERATOR_SYSTEM_PROMPT,
     GENERATOR_HUMAN_PROMPT,
     ROUTER_SYSTEM_PROMPT,
+    ROUTE_AND_REWRITE_SYSTEM_PROMPT,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "GENERATOR_SYSTEM_PROMPT",
     "GENERATOR_HUMAN_PROMPT",
     "ROUTER_SYSTEM_PROMPT",
+    "ROUTE_AND_REWRITE_SYSTEM_PROMPT",
 ]
@@ -0,0 +1,61 @@
+"""
+Evaluation Callbacks
+
+LangGraph 실행에서 노드별 실제 소요 시간을 수집하는 콜백 핸들러
+"""
+
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class LatencyCallbackHandler(BaseCallbackHandler):
+    """노드별 지연 시간 측정 콜백
+
+    LangGraph는 각 노드 실행을 체인 콜백으로 노출하며, metadata의
+    langgraph_node에 노드 이름이 담깁니다. on_chain_start/end에서
+    perf_counter_ns를 기록해 노드별 실제 소요 시간(ms)을 집계합니다.
+
+    핸들러는 invoke 1회당 새로 만들어 사용합니다 (상태 공유 없음).
+    """
+
+    def __init__(self):
+        super().__init__()
+        # run_id → (노드 이름, 시작 ns)
+        self._starts: Dict[UUID, tuple] = {}
+        # 노드 내부의 중첩 체인이 같은 metadata를 상속하므로,
+        # 노드당 최상위 run 1개만 측정해 중복 집계를 방지
+        self._open_nodes: set = set()
+        # 노드 이름 → 누적 ms
+        self.node_ms: Dict[str, float] = {}
+
+    def on_chain_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        inputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        if node and node not in self._open_nodes:
+            self._open_nodes.add(node)
+            self._starts[run_id] = (node, time.perf_counter_ns())
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def _finish(self, run_id: UUID) -> None:
+        entry = self._starts.pop(run_id, None)
+        if entry is None:
+            return
+        node, start_ns = entry
+        self._open_nodes.discard(node)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        self.node_ms[node] = self.node_ms.get(node, 0.0) + elapsed_ms
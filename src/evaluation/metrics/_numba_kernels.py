@@ -0,0 +1,60 @@
+"""
+Numba Kernels - Retrieval 메트릭 JIT 커널 (선택적 의존성)
+
+numba가 설치된 환경에서만 활성화됩니다. 수천 샘플 배치 평가에서
+메트릭 계산부의 인터프리터 오버헤드를 제거하기 위한 것으로,
+미설치 시 호출 측은 순수 파이썬 경로로 폴백합니다 (RAGAS와 동일한 패턴).
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# nDCG discount: 1/log2(rank+1), rank는 1부터 (인덱스 i의 discount = 1/log2(i+2))
+_DISCOUNT_TABLE = 1.0 / np.log2(np.arange(2, 1026, dtype=np.float64))
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def retrieval_metrics_from_hits(hits: np.ndarray, num_relevant: int):
+        """검색 결과 hit 마스크에서 6개 메트릭을 한 번에 계산
+
+        Args:
+            hits: 검색 결과 전체(순위순)의 정답 여부 (float64, 1.0/0.0)
+                  MRR은 전체 순위를, recall/ndcg/hit은 상위 10개를 사용
+            num_relevant: 정답 문서 수 (> 0)
+
+        Returns:
+            (recall@5, recall@10, ndcg@10, mrr, hit@5, hit@10) 튜플
+        """
+        n = hits.shape[0]
+
+        hits_at_5 = 0.0
+        hits_at_10 = 0.0
+        dcg = 0.0
+        mrr_value = 0.0
+        for i in range(n):
+            if hits[i] > 0.0:
+                if i < 10:
+                    hits_at_10 += 1.0
+                    dcg += _DISCOUNT_TABLE[i]
+                if i < 5:
+                    hits_at_5 += 1.0
+                if mrr_value == 0.0:
+                    mrr_value = 1.0 / (i + 1)
+
+        ideal = min(num_relevant, 10)
+        idcg = 0.0
+        for i in range(ideal):
+            idcg += _DISCOUNT_TABLE[i]
+
+        ndcg = dcg / idcg if idcg > 0.0 else 0.0
+        recall_5 = hits_at_5 / num_relevant
+        recall_10 = hits_at_10 / num_relevant
+        return recall_5, recall_10, ndcg, mrr_value, hits_at_5 > 0.0, hits_at_10 > 0.0
+
+else:
+    retrieval_metrics_from_hits = None
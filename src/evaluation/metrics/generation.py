@@ -15,22 +15,50 @@ LLM 생성 품질을 측정하는 RAGAS 기반 메트릭
 """
 
 import asyncio
+import importlib.util
 from typing import Optional, List
 from src.evaluation.schemas import GenerationMetrics
 
-# RAGAS imports (optional - graceful fallback if not installed)
-try:
-    from ragas import evaluate
+# RAGAS 설치 여부는 find_spec으로만 확인 (모듈을 실행하지 않음)
+# ragas/datasets는 pandas·pyarrow·HF hub를 끌고 들어와 import에만 수 초와
+# 수백 MB가 들므로, 실제 평가가 처음 실행될 때 지연 import합니다.
+RAGAS_AVAILABLE = (
+    importlib.util.find_spec("ragas") is not None
+    and importlib.util.find_spec("datasets") is not None
+)
+
+# _lazy_import()가 첫 평가 시점에 채우는 심볼들
+evaluate = None
+faithfulness = None
+answer_relevancy = None
+context_precision = None
+context_recall = None
+Dataset = None
+
+
+def _lazy_import() -> None:
+    """RAGAS/datasets 심볼을 첫 사용 시점에 1회 로드"""
+    global evaluate, faithfulness, answer_relevancy
+    global context_precision, context_recall, Dataset
+
+    if evaluate is not None:
+        return
+
+    from ragas import evaluate as _evaluate
     from ragas.metrics import (
-        faithfulness,
-        answer_relevancy,
-        context_precision,
-        context_recall,
+        faithfulness as _faithfulness,
+        answer_relevancy as _answer_relevancy,
+        context_precision as _context_precision,
+        context_recall as _context_recall,
     )
-    from datasets import Dataset
-    RAGAS_AVAILABLE = True
-except ImportError:
-    RAGAS_AVAILABLE = False
+    from datasets import Dataset as _Dataset
+
+    evaluate = _evaluate
+    faithfulness = _faithfulness
+    answer_relevancy = _answer_relevancy
+    context_precision = _context_precision
+    context_recall = _context_recall
+    Dataset = _Dataset
 
 
 class GenerationEvaluator:
@@ -75,7 +103,7 @@ class GenerationEvaluator:
             return GenerationMetrics()
 
         try:
-            return asyncio.run(
+            return self._run_sync(
                 self.evaluate_async(
                     question=question,
                     answer=answer,
@@ -88,6 +116,25 @@ class GenerationEvaluator:
             print(f"[Error] RAGAS evaluation failed: {e}")
             return GenerationMetrics()
 
+    @staticmethod
+    def _run_sync(coro):
+        """코루틴을 동기적으로 실행 (실행 중인 이벤트 루프 안전)
+
+        asyncio.run은 이미 실행 중인 루프 안에서 호출되면 RuntimeError를
+        던지고, 기존에는 except가 이를 삼켜 메트릭이 조용히 빈 값으로
+        떨어졌습니다. 루프 안에서 호출되면 워커 스레드의 새 루프에서
+        실행하여 결과를 정상 반환합니다. (async 호출자는 evaluate_async를
+        직접 await하는 것이 더 효율적)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
     async def evaluate_async(
         self,
         question: str,
@@ -113,6 +160,8 @@ class GenerationEvaluator:
             return GenerationMetrics()
 
         try:
+            _lazy_import()
+
             # RAGAS 데이터셋 형식으로 변환
             data = {
                 "question": [question],
@@ -127,11 +176,13 @@ class GenerationEvaluator:
             dataset = Dataset.from_dict(data)
 
             # 평가할 메트릭 선택
+            # context_precision/recall은 정답(reference)이 필요하므로
+            # ground_truth가 없으면 아예 제외 (불필요한 LLM 호출 방지: 4회→2회)
             metrics_to_evaluate = [faithfulness]
             if include_all_metrics:
                 metrics_to_evaluate.append(answer_relevancy)
-                metrics_to_evaluate.append(context_precision)
                 if ground_truth:
+                    metrics_to_evaluate.append(context_precision)
                     metrics_to_evaluate.append(context_recall)
 
             # RAGAS 평가 실행
@@ -149,6 +200,99 @@ class GenerationEvaluator:
             print(f"[Error] RAGAS async evaluation failed: {e}")
             return GenerationMetrics()
 
+    def evaluate_batch(
+        self,
+        questions: List[str],
+        answers: List[str],
+        contexts_list: List[List[str]],
+        ground_truths: Optional[List[Optional[str]]] = None,
+        include_all_metrics: bool = True,
+    ) -> List[GenerationMetrics]:
+        """배치 평가 실행 (단일 RAGAS evaluate 호출)
+
+        샘플마다 1행짜리 Dataset으로 evaluate를 반복하면 RAGAS 내부의
+        메트릭 LLM 호출 배칭을 전혀 활용하지 못합니다. 전체 샘플을 하나의
+        Dataset으로 모아 evaluate를 1회만 호출하면 RAGAS가 자체 동시성
+        관리자로 4×B개의 LLM 호출을 파이프라이닝합니다.
+
+        Args:
+            questions: 질문 리스트
+            answers: 생성된 답변 리스트
+            contexts_list: 샘플별 검색 문서 리스트
+            ground_truths: 샘플별 정답 (없는 샘플은 None)
+            include_all_metrics: 모든 메트릭 계산 여부 (False면 faithfulness만)
+
+        Returns:
+            샘플 순서대로 GenerationMetrics 리스트
+        """
+        if not RAGAS_AVAILABLE or not questions:
+            return [GenerationMetrics() for _ in questions]
+
+        try:
+            _lazy_import()
+
+            data = {
+                "question": list(questions),
+                "answer": list(answers),
+                "contexts": list(contexts_list),
+            }
+
+            # context_recall은 모든 샘플에 정답이 있을 때만 평가 가능
+            # (RAGAS는 컬럼 단위로 동작하므로 행별 생략 불가)
+            has_all_ground_truths = (
+                ground_truths is not None and all(gt for gt in ground_truths)
+            )
+            if has_all_ground_truths:
+                data["ground_truth"] = list(ground_truths)
+
+            dataset = Dataset.from_dict(data)
+
+            # context 계열 메트릭은 정답이 전부 있을 때만 (단건 경로와 동일 기준)
+            metrics_to_evaluate = [faithfulness]
+            if include_all_metrics:
+                metrics_to_evaluate.append(answer_relevancy)
+                if has_all_ground_truths:
+                    metrics_to_evaluate.append(context_precision)
+                    metrics_to_evaluate.append(context_recall)
+
+            result = evaluate(dataset, metrics=metrics_to_evaluate)
+
+            # 행 단위 결과로 분해
+            df = result.to_pandas()
+
+            def column(name: str) -> List[Optional[float]]:
+                if name not in df.columns:
+                    return [None] * len(df)
+                return [self._safe_float(v) for v in df[name].tolist()]
+
+            return [
+                GenerationMetrics(
+                    faithfulness=faith,
+                    answer_relevancy=rel,
+                    context_precision=prec,
+                    context_recall=rec,
+                )
+                for faith, rel, prec, rec in zip(
+                    column("faithfulness"),
+                    column("answer_relevancy"),
+                    column("context_precision"),
+                    column("context_recall"),
+                )
+            ]
+
+        except Exception as e:
+            print(f"[Error] RAGAS batch evaluation failed: {e}")
+            return [GenerationMetrics() for _ in questions]
+
+    @staticmethod
+    def _safe_float(value) -> Optional[float]:
+        """float 변환 (NaN/변환 불가 값은 None)"""
+        try:
+            result = float(value)
+            return None if result != result else result
+        except (TypeError, ValueError):
+            return None
+
     def _safe_get(self, result: dict, key: str) -> Optional[float]:
         """안전하게 결과값 추출"""
         try:
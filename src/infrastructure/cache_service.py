@@ -3,13 +3,16 @@ Redis Cache Service
 
 Infrastructure Layer: 캐시 관리 (쿼리-응답 캐싱)
 """
-import json
 import hashlib
-from typing import Optional, Any
+import time
+from typing import List, Optional, Any, Tuple
 
+import numpy as np
+import orjson
 import redis
 
 from src.core import Settings
+from .redis_client import get_redis, get_async_redis
 
 
 class CacheService:
@@ -18,23 +21,48 @@ class CacheService:
     def __init__(self, settings: Settings):
         self.settings = settings
         self._client: Optional[redis.Redis] = None
+        self._raw_client: Optional[redis.Redis] = None
+        self._aclient = None
+        # 시맨틱 캐시: (정규화된 질문 임베딩, 만료 시각, 답변)
+        self._semantic_entries: List[Tuple[np.ndarray, float, str]] = []
 
     @property
     def client(self) -> redis.Redis:
         """Lazy Loading 패턴"""
         if self._client is None:
-            self._client = redis.Redis(
-                host=self.settings.redis.host,
-                port=self.settings.redis.port,
-                db=self.settings.redis.db,
-                decode_responses=True
-            )
+            self._client = get_redis(self.settings, decode_responses=True)
         return self._client
 
+    @property
+    def raw_client(self) -> redis.Redis:
+        """바이너리 값(임베딩 등)용 클라이언트 (Lazy Loading)
+
+        decode_responses 없이 bytes를 그대로 주고받습니다.
+        """
+        if self._raw_client is None:
+            self._raw_client = get_redis(self.settings, decode_responses=False)
+        return self._raw_client
+
+    @property
+    def aclient(self):
+        """비동기 클라이언트 (Lazy Loading)
+
+        FastAPI 핸들러에서 동기 클라이언트를 쓰면 Redis 왕복 동안
+        이벤트 루프가 멈추므로, async 경로는 이쪽을 사용합니다.
+        """
+        if self._aclient is None:
+            self._aclient = get_async_redis(self.settings, decode_responses=True)
+        return self._aclient
+
     def _make_key(self, question: str) -> str:
-        """질문을 해시하여 캐시 키 생성"""
+        """질문을 해시하여 캐시 키 생성
+
+        캐시 키는 암호학적 충돌 저항이 필요 없으므로 SHA-256의 64라운드
+        대신 blake2b 8바이트 다이제스트를 사용합니다 (키 길이 동일: 16 hex).
+        기존 SHA-256 키는 TTL로 자연 만료됩니다.
+        """
         normalized = question.strip().lower()
-        hash_value = hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        hash_value = hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
         return f"rag:query:{hash_value}"
 
     def get_cached_response(self, question: str) -> Optional[dict]:
@@ -50,7 +78,7 @@ class CacheService:
             key = self._make_key(question)
             cached = self.client.get(key)
             if cached:
-                return json.loads(cached)
+                return orjson.loads(cached)
             return None
         except redis.RedisError:
             # Redis 연결 실패 시 캐시 미스로 처리
@@ -85,23 +113,201 @@ class CacheService:
             self.client.setex(
                 key,
                 self.settings.redis.ttl,
-                json.dumps(data, ensure_ascii=False)
+                # orjson: UTF-8 네이티브 직렬화 (한국어 이스케이프 분기 없음, bytes 반환)
+                orjson.dumps(data)
             )
             return True
         except redis.RedisError:
             return False
 
+    async def aget_cached_response(self, question: str) -> Optional[dict]:
+        """캐시된 응답 조회 (비동기, 이벤트 루프 논블로킹)"""
+        try:
+            key = self._make_key(question)
+            cached = await self.aclient.get(key)
+            if cached:
+                return orjson.loads(cached)
+            return None
+        except redis.RedisError:
+            return None
+
+    async def acache_response(
+        self,
+        question: str,
+        answer: str,
+        sources: list,
+        processing_time_ms: float
+    ) -> bool:
+        """응답을 캐시에 저장 (비동기, 이벤트 루프 논블로킹)"""
+        try:
+            key = self._make_key(question)
+            data = {
+                "answer": answer,
+                "sources": sources,
+                "processing_time_ms": processing_time_ms,
+                "cached": True
+            }
+            await self.aclient.setex(
+                key,
+                self.settings.redis.ttl,
+                # orjson: UTF-8 네이티브 직렬화 (한국어 이스케이프 분기 없음, bytes 반환)
+                orjson.dumps(data)
+            )
+            return True
+        except redis.RedisError:
+            return False
+
+    @staticmethod
+    def _embedding_key(model: str, text: str) -> str:
+        """임베딩 캐시 키 생성 (모델명 + 텍스트 해시)"""
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        return f"emb:{model}:{text_hash}"
+
+    def mget_embeddings(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """텍스트별 캐시된 임베딩 일괄 조회
+
+        Args:
+            model: 임베딩 모델명
+            texts: 조회할 텍스트 리스트
+
+        Returns:
+            텍스트 순서대로 임베딩 또는 None (캐시 미스)
+        """
+        if not texts:
+            return []
+        try:
+            keys = [self._embedding_key(model, text) for text in texts]
+            values = self.raw_client.mget(keys)
+            return [
+                np.frombuffer(v, dtype=np.float16).astype(np.float32).tolist() if v else None
+                for v in values
+            ]
+        except redis.RedisError:
+            return [None] * len(texts)
+
+    def mset_embeddings(self, model: str, texts: List[str], vectors: List[List[float]]) -> bool:
+        """임베딩 일괄 저장 (FP16으로 압축하여 캐시 크기 절반으로 축소)"""
+        try:
+            pipe = self.raw_client.pipeline(transaction=False)
+            for text, vector in zip(texts, vectors):
+                key = self._embedding_key(model, text)
+                value = np.asarray(vector, dtype=np.float16).tobytes()
+                pipe.setex(key, self.settings.redis.ttl, value)
+            pipe.execute()
+            return True
+        except redis.RedisError:
+            return False
+
+    def semantic_get(self, embedding: List[float], threshold: Optional[float] = None) -> Optional[str]:
+        """질문 임베딩과 유사한 캐시 항목의 답변 조회
+
+        의미상 같은 질문(표현만 다른 질문)에 대해 전체 워크플로우 실행을
+        생략하기 위한 인메모리 시맨틱 캐시입니다.
+
+        Args:
+            embedding: 질문의 Dense 임베딩
+            threshold: 코사인 유사도 임계값 (기본값: settings)
+
+        Returns:
+            캐시된 답변 또는 None
+        """
+        if threshold is None:
+            threshold = self.settings.redis.semantic_threshold
+
+        self._prune_semantic()
+        if not self._semantic_entries:
+            return None
+
+        query_vec = self._normalize(embedding)
+        matrix = np.stack([entry[0] for entry in self._semantic_entries])
+        similarities = matrix @ query_vec
+        best_idx = int(np.argmax(similarities))
+        if similarities[best_idx] >= threshold:
+            # LRU: 히트 항목을 리스트 끝(최근 사용)으로 이동
+            entry = self._semantic_entries.pop(best_idx)
+            self._semantic_entries.append(entry)
+            return entry[2]
+        return None
+
+    def semantic_put(self, embedding: List[float], answer: str) -> None:
+        """질문 임베딩과 답변을 시맨틱 캐시에 저장 (LRU 퇴출)"""
+        if len(self._semantic_entries) >= self.settings.redis.semantic_max_entries:
+            del self._semantic_entries[0]  # 가장 오래 사용되지 않은 항목 퇴출
+        expires_at = time.monotonic() + self.settings.redis.semantic_ttl
+        self._semantic_entries.append((self._normalize(embedding), expires_at, answer))
+
+    def _prune_semantic(self) -> None:
+        """만료된 시맨틱 캐시 항목 제거"""
+        now = time.monotonic()
+        self._semantic_entries = [e for e in self._semantic_entries if e[1] > now]
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """코사인 유사도 계산을 위한 L2 정규화"""
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    # ============ 업로드 작업 상태 (Redis Hash) ============
+
+    @staticmethod
+    def _task_key(task_id: str) -> str:
+        return f"rag:task:{task_id}"
+
+    def set_task(self, task_id: str, mapping: dict, ttl: int = 86400) -> bool:
+        """업로드 작업 상태 저장 (TTL 포함)
+
+        멀티 워커 환경에서 어느 워커든 상태를 조회할 수 있도록
+        인메모리 dict 대신 Redis Hash에 저장합니다.
+        """
+        try:
+            key = self._task_key(task_id)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl)
+            pipe.execute()
+            return True
+        except redis.RedisError:
+            return False
+
+    def update_task(self, task_id: str, mapping: dict) -> bool:
+        """업로드 작업 상태 갱신 (다중 필드 HSET은 원자적)"""
+        try:
+            self.client.hset(self._task_key(task_id), mapping=mapping)
+            return True
+        except redis.RedisError:
+            return False
+
+    def get_task(self, task_id: str) -> Optional[dict]:
+        """업로드 작업 상태 조회"""
+        try:
+            data = self.client.hgetall(self._task_key(task_id))
+            return data or None
+        except redis.RedisError:
+            return None
+
     def invalidate_all(self) -> int:
         """모든 RAG 쿼리 캐시 삭제 (문서 업로드 시 호출)
 
         Returns:
             삭제된 키 개수
         """
+        # KEYS는 서버를 O(N)으로 블로킹하고 전체 키를 한 번에 적재하므로,
+        # 커서 기반 SCAN(호출당 O(1)) + 파이프라인 UNLINK(비동기 해제)로
+        # 대체합니다. 대량 캐시에서도 다른 Redis 클라이언트를 멈추지 않음.
         try:
-            keys = self.client.keys("rag:query:*")
-            if keys:
-                return self.client.delete(*keys)
-            return 0
+            count = 0
+            pipe = self.client.pipeline(transaction=False)
+            batched = 0
+            for key in self.client.scan_iter(match="rag:query:*", count=500):
+                pipe.unlink(key)
+                batched += 1
+                if batched >= 500:
+                    count += sum(pipe.execute())
+                    batched = 0
+            if batched:
+                count += sum(pipe.execute())
+            return count
         except redis.RedisError:
             return 0
 
@@ -117,3 +323,6 @@ class CacheService:
         if self._client is not None:
             self._client.close()
             self._client = None
+        if self._raw_client is not None:
+            self._raw_client.close()
+            self._raw_client = None
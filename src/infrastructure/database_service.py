@@ -28,12 +28,20 @@ class DatabaseService:
     def engine(self):
         """Lazy Loading 패턴"""
         if self._engine is None:
+            # 풀 크기는 설정으로 조정: 기본 5+10은 동시 요청에서 커넥션
+            # 대기를 유발하므로 상향.
+            #
+            # pool_pre_ping은 체크아웃마다 SELECT 1 왕복(~0.5-2ms)을
+            # 추가하므로 사용하지 않습니다. 대신 pool_recycle(기본 300초)로
+            # 유휴 끊김을 예방하고, 그래도 남는 드문 끊긴 커넥션은
+            # SQLAlchemy가 disconnect 오류 감지 시 풀을 무효화하여
+            # 다음 체크아웃에서 새 커넥션으로 복구합니다.
             self._engine = create_engine(
                 self.settings.database.url,
                 echo=False,  # SQL 로깅 비활성화
-                pool_size=5,
-                max_overflow=10,
-                pool_pre_ping=True  # 연결 유효성 확인
+                pool_size=self.settings.database.pool_size,
+                max_overflow=self.settings.database.max_overflow,
+                pool_recycle=self.settings.database.pool_recycle,
             )
         return self._engine
 
@@ -53,14 +61,21 @@ class DatabaseService:
         return self.session_maker()
 
     @contextmanager
-    def session_scope(self) -> Generator[Session, None, None]:
+    def session_scope(self, session: Optional[Session] = None) -> Generator[Session, None, None]:
         """트랜잭션 범위 세션 컨텍스트 매니저
 
+        외부 세션이 주어지면 그대로 사용합니다: 커밋/종료는 소유자
+        (예: 요청 범위 의존성)가 담당하므로, 한 요청의 여러 Repository
+        호출이 BEGIN/COMMIT 1회를 공유할 수 있습니다.
+
         Usage:
             with db_service.session_scope() as session:
                 session.add(entity)
                 # 자동 커밋 또는 롤백
         """
+        if session is not None:
+            yield session
+            return
         session = self.get_session()
         try:
             yield session
@@ -3,9 +3,12 @@ LLM Service - OpenAI API 연동
 
 Infrastructure Layer: 외부 LLM 서비스와의 통신을 담당합니다.
 """
+import logging
+import threading
 import time
-from typing import Type, TypeVar
+from typing import Iterator, List, Optional, Type, TypeVar, Union
 from langchain_openai import ChatOpenAI
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from pydantic import BaseModel
@@ -28,49 +31,151 @@ class LLMService:
 
     def __init__(self, settings: Settings):
         self.settings = settings
+        # 동시 in-flight 호출 상한: 과도한 동시 요청이 OpenAI 레이트리밋을
+        # 치고 백오프 재시도로 오히려 지연을 키우는 것을 방지
+        self._sem = threading.BoundedSemaphore(settings.llm.max_concurrency)
+        # LLM 인스턴스 캐시: ChatOpenAI 생성은 env 해석 + openai.Client +
+        # httpx TLS 풀 구성 + pydantic 검증으로 호출당 수십 ms.
+        # 인스턴스를 재사용하면 내부 httpx 커넥션 풀(keep-alive)도 공유되어
+        # 호출마다 TLS 핸드셰이크를 반복하지 않음.
+        self._rewrite_llm: Optional[ChatOpenAI] = None
+        self._generator_llm: Optional[ChatOpenAI] = None
+        self._llm_lock = threading.Lock()
+        # 체인 캐시: RunnableSequence 구성(pydantic 검증 + 러너블 그래프
+        # 빌드)을 호출마다 반복하지 않도록 (id(prompt), id(llm)[, schema])
+        # 키로 메모이즈. 프롬프트/LLM은 모듈 상수·싱글톤이라 키가 유한하고
+        # 수명이 프로세스와 같으므로 퇴출 없는 dict면 충분 (경합 시 최악
+        # 중복 빌드 1회뿐이라 락 불필요).
+        self._chain_cache: dict = {}
 
     def get_rewrite_llm(self) -> ChatOpenAI:
-        """Query Rewrite용 LLM 반환"""
-        return ChatOpenAI(
-            model=self.settings.llm.rewrite_model,
-            temperature=self.settings.llm.rewrite_temperature,
-        )
+        """Query Rewrite용 LLM 반환 (인스턴스 캐시)"""
+        if self._rewrite_llm is None:
+            with self._llm_lock:
+                if self._rewrite_llm is None:
+                    self._rewrite_llm = ChatOpenAI(
+                        model=self.settings.llm.rewrite_model,
+                        temperature=self.settings.llm.rewrite_temperature,
+                    )
+        return self._rewrite_llm
 
     def get_generator_llm(self) -> ChatOpenAI:
-        """Generator용 LLM 반환"""
-        return ChatOpenAI(
-            model=self.settings.llm.generator_model,
-            temperature=self.settings.llm.generator_temperature,
-        )
+        """Generator용 LLM 반환 (인스턴스 캐시)"""
+        if self._generator_llm is None:
+            with self._llm_lock:
+                if self._generator_llm is None:
+                    self._generator_llm = ChatOpenAI(
+                        model=self.settings.llm.generator_model,
+                        temperature=self.settings.llm.generator_temperature,
+                    )
+        return self._generator_llm
+
+    def _get_string_chain(self, prompt: Optional[ChatPromptTemplate], llm: ChatOpenAI):
+        """문자열 출력 체인 조회 또는 구성 (메모이즈)
+
+        prompt가 None이면 포맷된 메시지 리스트를 직접 받는
+        `llm | StrOutputParser()` 체인을 반환합니다.
+        """
+        key = (id(prompt) if prompt is not None else None, id(llm))
+        chain = self._chain_cache.get(key)
+        if chain is None:
+            if prompt is not None:
+                chain = prompt | llm | StrOutputParser()
+            else:
+                chain = llm | StrOutputParser()
+            self._chain_cache[key] = chain
+        return chain
+
+    def invoke_chain(self, chain, input_data: dict):
+        """미리 구성된 체인 호출 (동시성 제한 적용)
+
+        build 시점에 1회 구성한 체인(프롬프트 | 구조화 LLM 등)을 재사용하는
+        호출 경로입니다. 요청마다 with_structured_output으로 스키마를
+        JSON 스펙으로 재컴파일하는 비용을 피합니다.
+        """
+        start_time = time.perf_counter()
+
+        with self._sem:
+            result = chain.invoke(input_data)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug("[LLM] 체인 호출 완료 (%.1fms)", elapsed_ms)
+        return result
 
     def invoke_with_structured_output(
         self, llm: ChatOpenAI, prompt: ChatPromptTemplate, output_schema: Type[T], input_data: dict
     ) -> T:
         """구조화된 출력으로 LLM 호출"""
-        logger.debug("[LLM] 구조화 출력 호출: model=%s, schema=%s",
-                    llm.model_name, output_schema.__name__)
-        start_time = time.time()
-
-        structured_llm = llm.with_structured_output(output_schema)
-        chain = prompt | structured_llm
-        result = chain.invoke(input_data)
-
-        elapsed_ms = (time.time() - start_time) * 1000
+        # isEnabledFor 가드: %-포맷은 지연되지만 model_name/__name__
+        # 속성 접근 자체는 매 호출 실행되므로, 디버그 비활성 시 통째로 생략
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[LLM] 구조화 출력 호출: model=%s, schema=%s",
+                         llm.model_name, output_schema.__name__)
+        start_time = time.perf_counter()
+
+        key = (id(prompt), id(llm), output_schema)
+        chain = self._chain_cache.get(key)
+        if chain is None:
+            chain = prompt | llm.with_structured_output(output_schema)
+            self._chain_cache[key] = chain
+        with self._sem:
+            result = chain.invoke(input_data)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         logger.info("[LLM] 구조화 출력 완료: model=%s (%.1fms)",
                    llm.model_name, elapsed_ms)
         return result
 
     def invoke_with_string_output(
-        self, llm: ChatOpenAI, prompt: ChatPromptTemplate, input_data: dict
+        self,
+        llm: ChatOpenAI,
+        prompt: Union[ChatPromptTemplate, List[BaseMessage]],
+        input_data: Optional[dict] = None,
     ) -> str:
-        """문자열 출력으로 LLM 호출"""
-        logger.debug("[LLM] 문자열 출력 호출: model=%s", llm.model_name)
-        start_time = time.time()
-
-        chain = prompt | llm | StrOutputParser()
-        result = chain.invoke(input_data)
-
-        elapsed_ms = (time.time() - start_time) * 1000
+        """문자열 출력으로 LLM 호출
+
+        prompt는 ChatPromptTemplate 또는 이미 포맷된 메시지 리스트를
+        받습니다. 메시지 리스트 경로는 LangChain 템플릿 엔진의
+        요청별 변수 파싱을 건너뜁니다 (핫패스 노드용).
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[LLM] 문자열 출력 호출: model=%s", llm.model_name)
+        start_time = time.perf_counter()
+
+        with self._sem:
+            if isinstance(prompt, ChatPromptTemplate):
+                result = self._get_string_chain(prompt, llm).invoke(input_data)
+            else:
+                result = self._get_string_chain(None, llm).invoke(prompt)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         logger.info("[LLM] 문자열 출력 완료: model=%s, 길이=%d (%.1fms)",
                    llm.model_name, len(result), elapsed_ms)
         return result
+
+    def stream_with_string_output(
+        self, llm: ChatOpenAI, prompt: ChatPromptTemplate, input_data: dict
+    ) -> Iterator[str]:
+        """문자열 출력으로 LLM 호출 (토큰 스트리밍)
+
+        invoke_with_string_output은 전체 답변이 완성될 때까지 블로킹하므로
+        첫 토큰까지의 체감 지연(TTFT)이 전체 생성 시간과 같습니다.
+        chain.stream으로 토큰이 도착하는 즉시 yield하여 소비자가
+        순차적으로 전달할 수 있게 합니다.
+
+        주의: 세마포어는 스트림이 소진/중단될 때까지 점유됩니다.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[LLM] 스트리밍 출력 호출: model=%s", llm.model_name)
+        start_time = time.perf_counter()
+
+        chain = self._get_string_chain(prompt, llm)
+        total_len = 0
+        with self._sem:
+            for token in chain.stream(input_data):
+                total_len += len(token)
+                yield token
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.info("[LLM] 스트리밍 출력 완료: model=%s, 길이=%d (%.1fms)",
+                   llm.model_name, total_len, elapsed_ms)
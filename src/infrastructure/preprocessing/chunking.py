@@ -3,6 +3,7 @@ Chunking Service - Semantic Chunking
 
 Infrastructure Layer: 의미 기반 청크 분할
 """
+import os
 import uuid
 from typing import Any, Dict, List
 
@@ -14,6 +15,19 @@ from src.core import Settings
 from src.domain.entities import Chunk, RawDocument
 
 
+def _uuid_batch(n: int) -> List[str]:
+    """UUID4 문자열 n개 일괄 생성
+
+    uuid.uuid4()는 호출마다 /dev/urandom을 읽으므로(시스템 콜),
+    수천 청크 문서에서는 os.urandom 1회로 엔트로피를 모아 생성합니다.
+    """
+    raw = os.urandom(16 * n)
+    return [
+        str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4))
+        for i in range(n)
+    ]
+
+
 class ChunkingService:
     """Semantic Chunking 서비스
 
@@ -34,7 +48,14 @@ class ChunkingService:
     def _initialize(self):
         """Lazy initialization"""
         if self._embeddings is None:
-            self._embeddings = OpenAIEmbeddings(model=self._config.embedding_model)
+            # chunk_size: OpenAI 요청 1건에 실어 보내는 문장 수.
+            # SemanticChunker가 문장별 임베딩을 요청해도 배치로 묶여
+            # 수십 번의 순차 왕복이 요청 1~2건으로 줄어듦.
+            self._embeddings = OpenAIEmbeddings(
+                model=self._config.embedding_model,
+                chunk_size=512,
+                max_retries=2,
+            )
             self._chunker = SemanticChunker(
                 embeddings=self._embeddings,
                 breakpoint_threshold_type=self._config.breakpoint_type,
@@ -45,11 +66,12 @@ class ChunkingService:
         """텍스트를 청크로 분할"""
         self._initialize()
         docs = self._chunker.create_documents([text])
+        chunk_ids = _uuid_batch(len(docs))
         chunks = []
         for i, doc in enumerate(docs):
             chunks.append(Chunk(
                 content=doc.page_content,
-                chunk_id=str(uuid.uuid4()),
+                chunk_id=chunk_ids[i],
                 chunk_index=i,
                 doc_id=doc_id,
                 source=source,
@@ -67,34 +89,42 @@ class ChunkingService:
             chunk_size=self._config.max_chunk_size, chunk_overlap=100,
             separators=["\n\n", "\n", ". ", ", ", " "]
         )
+        texts = splitter.split_text(chunk.content)
         return [Chunk(
-            content=t, chunk_id=str(uuid.uuid4()), chunk_index=0,
+            content=t, chunk_id=chunk_id, chunk_index=0,
             doc_id=doc_id, source=source, file_name=file_name, file_type=file_type,
             metadata={**chunk.metadata, "was_split": True}
-        ) for t in splitter.split_text(chunk.content)]
+        ) for t, chunk_id in zip(texts, _uuid_batch(len(texts)))]
 
     def _merge_small_chunks(self, chunks: List[Chunk], doc_id: str, source: str, file_name: str, file_type: str) -> List[Chunk]:
         """작은 청크 병합 (min_chunk_size 미만 시)"""
         if not chunks:
             return chunks
         min_size, max_size = self._config.min_chunk_size, self._config.max_chunk_size
-        merged, buffer = [], ""
+        # 버퍼를 문자열 이어붙이기 대신 조각 리스트 + 길이 카운터로 유지:
+        # 매 병합마다 기존 버퍼 전체를 복사하는 O(N²) 증가를 피하고,
+        # 실제 결합은 flush 시점의 join 1회로 끝냄
+        # 병합 결과 청크 수 상한은 len(chunks) + 1 (flush 횟수 기준)
+        merge_ids = iter(_uuid_batch(len(chunks) + 1))
+        merged, buffer_pieces, buffer_len = [], [], 0
         for chunk in chunks:
-            combined = buffer + ("\n\n" if buffer else "") + chunk.content
-            if chunk.char_count >= min_size and not buffer:
+            combined_len = buffer_len + (2 if buffer_pieces else 0) + chunk.char_count
+            if chunk.char_count >= min_size and not buffer_pieces:
                 merged.append(chunk)
-            elif len(combined) <= max_size:
-                buffer = combined
+            elif combined_len <= max_size:
+                buffer_pieces.append(chunk.content)
+                buffer_len = combined_len
             else:
-                if buffer:
+                if buffer_pieces:
                     merged.append(Chunk(
-                        content=buffer, chunk_id=str(uuid.uuid4()), chunk_index=0,
+                        content="\n\n".join(buffer_pieces), chunk_id=next(merge_ids), chunk_index=0,
                         doc_id=doc_id, source=source, file_name=file_name, file_type=file_type, metadata={"was_merged": True}
                     ))
-                buffer = chunk.content
-        if buffer:
+                buffer_pieces = [chunk.content]
+                buffer_len = chunk.char_count
+        if buffer_pieces:
             merged.append(Chunk(
-                content=buffer, chunk_id=str(uuid.uuid4()), chunk_index=0,
+                content="\n\n".join(buffer_pieces), chunk_id=next(merge_ids), chunk_index=0,
                 doc_id=doc_id, source=source, file_name=file_name, file_type=file_type, metadata={}
             ))
         return merged
@@ -4,9 +4,11 @@ Preprocessing Pipeline
 Infrastructure Layer: 문서 전처리 파이프라인
 파싱 → 정규화 → 청킹 순서로 처리합니다.
 """
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from src.core import Settings
 from src.domain.entities import Chunk, DocumentMetadata, PreprocessingResult, RawDocument
@@ -14,6 +16,20 @@ from .chunking import ChunkingService
 from .normalizer import TextNormalizer
 from .parsers import UnifiedFileParser
 
+# 워커 프로세스 전용 파이프라인 (프로세스당 1회 구성, 공유 상태 없음)
+_worker_pipeline = None
+
+
+def _init_worker(settings: Settings) -> None:
+    """워커 프로세스 초기화: 파서/정규화/청킹 서비스를 자체 구성"""
+    global _worker_pipeline
+    _worker_pipeline = PreprocessingPipeline(settings)
+
+
+def _process_one(file_path: str) -> PreprocessingResult:
+    """워커 프로세스에서 단일 파일 처리 (최상위 함수: pickle 가능)"""
+    return _worker_pipeline.process_file(file_path)
+
 
 class PreprocessingPipeline:
     """문서 전처리 파이프라인
@@ -24,11 +40,16 @@ class PreprocessingPipeline:
     3. 청킹: 의미 단위로 분할
     """
 
+    # 순회에서 제외할 디렉토리 (숨김 디렉토리는 이름으로 별도 제외)
+    _SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
     def __init__(self, settings: Settings):
         self.settings = settings
         self._parser = UnifiedFileParser()
         self._normalizer = TextNormalizer(settings)
         self._chunking_service = ChunkingService(settings)
+        # 확장자 멤버십 검사를 O(1)로 (파일마다 리스트 선형 탐색 방지)
+        self._supported_set = frozenset(self._parser.get_supported_extensions())
 
     def process_file(self, file_path: str) -> PreprocessingResult:
         """단일 파일 처리"""
@@ -56,16 +77,79 @@ class PreprocessingPipeline:
         except Exception as e:
             return PreprocessingResult(document=None, chunks=[], metadata=None, stats={}, success=False, error=str(e))
 
-    def process_directory(self, dir_path: str, recursive: bool = False) -> List[PreprocessingResult]:
-        """디렉토리 일괄 처리"""
-        results = []
-        pattern = "**/*" if recursive else "*"
-        for file_path in Path(dir_path).glob(pattern):
-            if file_path.is_file() and file_path.suffix.lower().lstrip(".") in self._parser.get_supported_extensions():
-                result = self.process_file(str(file_path))
-                results.append(result)
-                print(f"{'✓' if result.success else '✗'} {file_path.name}: {result.stats.get('count', 0)}개 청크" if result.success else result.error)
-        return results
+    def iter_process_directory(
+        self, dir_path: str, recursive: bool = False, workers: int = 1
+    ) -> Iterator[PreprocessingResult]:
+        """디렉토리 처리 결과를 파일 단위로 스트리밍
+
+        결과마다 원문 문서 + 청크 전체를 들고 있으므로, 리스트로 모으면
+        수천 파일 수집에서 피크 메모리가 O(N·문서 크기)로 커집니다.
+        완료되는 대로 yield하여 호출자가 적재 후 버릴 수 있게 합니다.
+
+        파싱/정규화/청킹은 CPU 바운드이므로 workers > 1이면 파일 단위로
+        프로세스 풀에 분배합니다. 워커는 자체 파이프라인을 구성하고
+        출력(print)은 메인 프로세스에서만 수행합니다.
+
+        Args:
+            dir_path: 대상 디렉토리
+            recursive: 하위 디렉토리 포함 여부
+            workers: 병렬 워커 프로세스 수 (1이면 순차 처리)
+
+        Yields:
+            파일별 PreprocessingResult
+        """
+        if workers > 1:
+            paths = list(self._iter_files(dir_path, recursive))
+            if len(paths) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker, initargs=(self.settings,)
+                ) as executor:
+                    for file_path, result in zip(paths, executor.map(_process_one, paths)):
+                        self._report(file_path, result)
+                        yield result
+                return
+
+        for file_path in self._iter_files(dir_path, recursive):
+            result = self.process_file(file_path)
+            self._report(file_path, result)
+            yield result
+
+    def process_directory(
+        self, dir_path: str, recursive: bool = False, workers: int = 1
+    ) -> List[PreprocessingResult]:
+        """디렉토리 일괄 처리 (전체 결과 리스트 반환)
+
+        스트리밍이 필요 없는 호출자용 래퍼입니다. 대량 수집에서는
+        iter_process_directory를 사용하세요.
+        """
+        return list(self.iter_process_directory(dir_path, recursive, workers))
+
+    def _iter_files(self, dir_path: str, recursive: bool) -> Iterator[str]:
+        """지원 확장자 파일 경로 순회 (os.scandir 기반)
+
+        Path.glob은 엔트리마다 Path 객체 생성과 추가 stat 호출을 수반
+        합니다. os.scandir은 디렉토리 읽기에서 얻은 d_type을 캐시하므로
+        파일 여부 판정에 syscall이 들지 않고, 확장자 필터도 stat 전에
+        문자열 연산으로 끝냅니다. 숨김/버전관리 디렉토리는 진입 전에
+        건너뜁니다.
+        """
+        stack = [dir_path]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not entry.name.startswith(".") and entry.name not in self._SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if entry.name.rpartition(".")[2].lower() in self._supported_set:
+                            yield entry.path
+
+    @staticmethod
+    def _report(file_path: str, result: PreprocessingResult) -> None:
+        """파일 처리 결과 출력 (메인 프로세스 전용)"""
+        name = Path(file_path).name
+        print(f"✓ {name}: {result.stats.get('count', 0)}개 청크" if result.success else f"✗ {name}: {result.error}")
 
     def get_supported_extensions(self) -> List[str]:
         return self._parser.get_supported_extensions()
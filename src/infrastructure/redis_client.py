@@ -0,0 +1,81 @@
+"""
+Redis Client - 공유 커넥션 풀
+
+Infrastructure Layer: 프로세스 전역 Redis 커넥션 풀을 관리합니다.
+
+왜 커넥션 풀 싱글톤인가?
+- 클라이언트를 매번 새로 만들면 첫 명령마다 TCP 핸드셰이크 비용 발생
+- 풀을 공유하면 핸드셰이크가 수천 번의 명령에 걸쳐 상각됨
+- decode_responses는 커넥션 속성이므로 디코딩 여부별로 풀을 분리
+"""
+import threading
+from typing import Dict, Tuple
+
+import redis
+import redis.asyncio as aioredis
+
+from src.core import Settings
+
+_pools: Dict[Tuple[str, int, int, bool], redis.ConnectionPool] = {}
+_async_pools: Dict[Tuple[str, int, int, bool], aioredis.ConnectionPool] = {}
+_lock = threading.Lock()
+
+
+def get_redis(settings: Settings, decode_responses: bool = True) -> redis.Redis:
+    """공유 커넥션 풀 기반 Redis 클라이언트 반환 (Lazy Loading)
+
+    Args:
+        settings: 애플리케이션 설정
+        decode_responses: True면 str, False면 bytes 응답 (임베딩 등 바이너리용)
+
+    Returns:
+        공유 풀에 연결된 Redis 클라이언트
+    """
+    key = (
+        settings.redis.host,
+        settings.redis.port,
+        settings.redis.db,
+        decode_responses,
+    )
+    pool = _pools.get(key)
+    if pool is None:
+        with _lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = redis.ConnectionPool(
+                    host=settings.redis.host,
+                    port=settings.redis.port,
+                    db=settings.redis.db,
+                    max_connections=50,
+                    decode_responses=decode_responses,
+                )
+                _pools[key] = pool
+    return redis.Redis(connection_pool=pool)
+
+
+def get_async_redis(settings: Settings, decode_responses: bool = True) -> aioredis.Redis:
+    """공유 커넥션 풀 기반 비동기 Redis 클라이언트 반환 (Lazy Loading)
+
+    FastAPI 핸들러 등 이벤트 루프 위에서는 동기 클라이언트가
+    Redis 왕복 동안 루프를 블로킹하므로 이쪽을 사용합니다.
+    """
+    key = (
+        settings.redis.host,
+        settings.redis.port,
+        settings.redis.db,
+        decode_responses,
+    )
+    pool = _async_pools.get(key)
+    if pool is None:
+        with _lock:
+            pool = _async_pools.get(key)
+            if pool is None:
+                pool = aioredis.ConnectionPool(
+                    host=settings.redis.host,
+                    port=settings.redis.port,
+                    db=settings.redis.db,
+                    max_connections=50,
+                    decode_responses=decode_responses,
+                )
+                _async_pools[key] = pool
+    return aioredis.Redis(connection_pool=pool)
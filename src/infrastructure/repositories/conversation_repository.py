@@ -3,11 +3,13 @@ Conversation Repository
 
 Infrastructure Layer: 대화 히스토리 데이터 접근
 """
-from typing import TYPE_CHECKING, List, Optional
+from typing import List, Optional
 
-if TYPE_CHECKING:
-    from src.domain.entities import Conversation
+from sqlalchemy.orm import Session
 
+# 엔티티 → database_service(Base) → core 방향의 단방향 의존이라 순환이
+# 없으므로 모듈 수준에서 1회 import (메서드마다 sys.modules 조회 제거)
+from src.domain.entities.conversation import Conversation
 from src.infrastructure.database_service import DatabaseService
 
 
@@ -24,8 +26,9 @@ class ConversationRepository:
         answer: str,
         sources: Optional[list] = None,
         routing_decision: Optional[str] = None,
-        processing_time_ms: Optional[float] = None
-    ) -> "Conversation":
+        processing_time_ms: Optional[float] = None,
+        session: Optional[Session] = None
+    ) -> Conversation:
         """새 대화 기록 생성
 
         Args:
@@ -39,8 +42,7 @@ class ConversationRepository:
         Returns:
             생성된 Conversation 엔티티
         """
-        from src.domain.entities.conversation import Conversation
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             conversation = Conversation(
                 user_id=user_id,
                 question=question,
@@ -55,12 +57,32 @@ class ConversationRepository:
             session.expunge(conversation)
             return conversation
 
+    def bulk_create(self, rows: List[dict], session: Optional[Session] = None) -> int:
+        """대화 기록 일괄 생성 (단일 executemany)
+
+        행마다 세션/flush/refresh를 반복하는 create와 달리 Core insert로
+        N건을 한 번의 라운드트립에 적재합니다. 생성된 엔티티가 필요 없는
+        대량 적재(배치 평가, 마이그레이션) 경로용입니다.
+
+        Args:
+            rows: Conversation 컬럼명을 키로 하는 dict 리스트
+
+        Returns:
+            삽입된 행 수
+        """
+        if not rows:
+            return 0
+        with self._db.session_scope(session) as session:
+            session.execute(Conversation.__table__.insert(), rows)
+            return len(rows)
+
     def get_by_user(
         self,
         user_id: int,
         limit: int = 50,
-        offset: int = 0
-    ) -> List["Conversation"]:
+        offset: int = 0,
+        session: Optional[Session] = None
+    ) -> List[Conversation]:
         """사용자별 대화 히스토리 조회
 
         Args:
@@ -71,8 +93,7 @@ class ConversationRepository:
         Returns:
             Conversation 목록 (최신순)
         """
-        from src.domain.entities.conversation import Conversation
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             conversations = (
                 session.query(Conversation)
                 .filter(Conversation.user_id == user_id)
@@ -85,7 +106,7 @@ class ConversationRepository:
                 session.expunge(conv)
             return conversations
 
-    def get_by_id(self, conversation_id: int) -> Optional["Conversation"]:
+    def get_by_id(self, conversation_id: int, session: Optional[Session] = None) -> Optional[Conversation]:
         """ID로 대화 조회
 
         Args:
@@ -94,8 +115,7 @@ class ConversationRepository:
         Returns:
             Conversation 엔티티 또는 None
         """
-        from src.domain.entities.conversation import Conversation
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             conversation = (
                 session.query(Conversation)
                 .filter(Conversation.id == conversation_id)
@@ -105,7 +125,7 @@ class ConversationRepository:
                 session.expunge(conversation)
             return conversation
 
-    def count_by_user(self, user_id: int) -> int:
+    def count_by_user(self, user_id: int, session: Optional[Session] = None) -> int:
         """사용자별 대화 개수
 
         Args:
@@ -114,8 +134,7 @@ class ConversationRepository:
         Returns:
             대화 개수
         """
-        from src.domain.entities.conversation import Conversation
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             return (
                 session.query(Conversation)
                 .filter(Conversation.user_id == user_id)
@@ -3,11 +3,13 @@ Document Repository
 
 Infrastructure Layer: 문서 메타데이터 데이터 접근
 """
-from typing import TYPE_CHECKING, List, Optional
+from typing import List, Optional
 
-if TYPE_CHECKING:
-    from src.domain.entities import Document
+from sqlalchemy.orm import Session
 
+# 엔티티 → database_service(Base) → core 방향의 단방향 의존이라 순환이
+# 없으므로 모듈 수준에서 1회 import (메서드마다 sys.modules 조회 제거)
+from src.domain.entities.conversation import Document
 from src.infrastructure.database_service import DatabaseService
 
 
@@ -22,8 +24,9 @@ class DocumentRepository:
         user_id: int,
         file_name: str,
         chunk_count: Optional[int] = None,
-        status: str = "completed"
-    ) -> "Document":
+        status: str = "completed",
+        session: Optional[Session] = None
+    ) -> Document:
         """새 문서 메타데이터 생성
 
         Args:
@@ -35,8 +38,7 @@ class DocumentRepository:
         Returns:
             생성된 Document 엔티티
         """
-        from src.domain.entities.conversation import Document
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             document = Document(
                 user_id=user_id,
                 file_name=file_name,
@@ -49,12 +51,32 @@ class DocumentRepository:
             session.expunge(document)
             return document
 
+    def bulk_create(self, rows: List[dict], session: Optional[Session] = None) -> int:
+        """문서 메타데이터 일괄 생성 (단일 executemany)
+
+        행마다 세션/flush/refresh를 반복하는 create와 달리 Core insert로
+        N건을 한 번의 라운드트립에 적재합니다. 다중 파일 업로드 등
+        생성된 엔티티가 필요 없는 대량 적재 경로용입니다.
+
+        Args:
+            rows: Document 컬럼명을 키로 하는 dict 리스트
+
+        Returns:
+            삽입된 행 수
+        """
+        if not rows:
+            return 0
+        with self._db.session_scope(session) as session:
+            session.execute(Document.__table__.insert(), rows)
+            return len(rows)
+
     def get_by_user(
         self,
         user_id: int,
         limit: int = 50,
-        offset: int = 0
-    ) -> List["Document"]:
+        offset: int = 0,
+        session: Optional[Session] = None
+    ) -> List[Document]:
         """사용자별 문서 목록 조회
 
         Args:
@@ -65,8 +87,7 @@ class DocumentRepository:
         Returns:
             Document 목록 (최신순)
         """
-        from src.domain.entities.conversation import Document
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             documents = (
                 session.query(Document)
                 .filter(Document.user_id == user_id)
@@ -79,7 +100,7 @@ class DocumentRepository:
                 session.expunge(doc)
             return documents
 
-    def get_by_id(self, document_id: int) -> Optional["Document"]:
+    def get_by_id(self, document_id: int, session: Optional[Session] = None) -> Optional[Document]:
         """ID로 문서 조회
 
         Args:
@@ -88,8 +109,7 @@ class DocumentRepository:
         Returns:
             Document 엔티티 또는 None
         """
-        from src.domain.entities.conversation import Document
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             document = (
                 session.query(Document)
                 .filter(Document.id == document_id)
@@ -103,8 +123,9 @@ class DocumentRepository:
         self,
         document_id: int,
         status: str,
-        chunk_count: Optional[int] = None
-    ) -> Optional["Document"]:
+        chunk_count: Optional[int] = None,
+        session: Optional[Session] = None
+    ) -> Optional[Document]:
         """문서 상태 업데이트
 
         Args:
@@ -115,8 +136,7 @@ class DocumentRepository:
         Returns:
             업데이트된 Document 엔티티 또는 None
         """
-        from src.domain.entities.conversation import Document
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             document = (
                 session.query(Document)
                 .filter(Document.id == document_id)
@@ -131,7 +151,7 @@ class DocumentRepository:
                 session.expunge(document)
             return document
 
-    def count_by_user(self, user_id: int) -> int:
+    def count_by_user(self, user_id: int, session: Optional[Session] = None) -> int:
         """사용자별 문서 개수
 
         Args:
@@ -140,8 +160,7 @@ class DocumentRepository:
         Returns:
             문서 개수
         """
-        from src.domain.entities.conversation import Document
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             return (
                 session.query(Document)
                 .filter(Document.user_id == user_id)
@@ -3,21 +3,34 @@ User Repository
 
 Infrastructure Layer: 사용자 데이터 접근
 """
-from typing import TYPE_CHECKING, Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 
-if TYPE_CHECKING:
-    from src.domain.entities import User
+from sqlalchemy.orm import Session
 
+# 엔티티 → database_service(Base) → core 방향의 단방향 의존이라 순환이
+# 없으므로 모듈 수준에서 1회 import (메서드마다 sys.modules 조회 제거)
+from src.domain.entities.user import User
 from src.infrastructure.database_service import DatabaseService
 
+# get_by_id TTL 캐시 설정: 인증된 요청마다 호출되는 핫패스이므로
+# 짧은 TTL로 DB 왕복을 TTL 윈도우당 1회로 압축 (User 행은 거의 불변)
+_CACHE_TTL_SECONDS = 60.0
+_CACHE_MAX_ENTRIES = 10_000
+
 
 class UserRepository:
     """사용자 Repository"""
 
     def __init__(self, database_service: DatabaseService):
         self._db = database_service
+        # user_id → (User 또는 None, 만료 시각). 엔티티는 expunge된
+        # detached 상태라 세션 없이 안전하게 재사용 가능.
+        # OrderedDict LRU: 개별 연산이 GIL 하에서 원자적이므로 락 불필요
+        self._cache: OrderedDict[int, Tuple[Optional[User], float]] = OrderedDict()
 
-    def create(self, username: str, password_hash: str) -> "User":
+    def create(self, username: str, password_hash: str, session: Optional[Session] = None) -> User:
         """새 사용자 생성
 
         Args:
@@ -27,8 +40,7 @@ class UserRepository:
         Returns:
             생성된 User 엔티티
         """
-        from src.domain.entities.user import User
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             user = User(username=username, password_hash=password_hash)
             session.add(user)
             session.flush()  # ID 생성을 위해 flush
@@ -37,8 +49,11 @@ class UserRepository:
             session.expunge(user)
             return user
 
-    def get_by_id(self, user_id: int) -> Optional["User"]:
-        """ID로 사용자 조회
+    def get_by_id(self, user_id: int, session: Optional[Session] = None) -> Optional[User]:
+        """ID로 사용자 조회 (TTL 캐시)
+
+        get_current_user 의존성이 인증 요청마다 호출하므로, TTL 내에는
+        DB를 거치지 않고 캐시된 detached 엔티티를 반환합니다.
 
         Args:
             user_id: 사용자 ID
@@ -46,14 +61,29 @@ class UserRepository:
         Returns:
             User 엔티티 또는 None
         """
-        from src.domain.entities.user import User
-        with self._db.session_scope() as session:
+        entry = self._cache.get(user_id)
+        if entry is not None:
+            user, expires_at = entry
+            if time.monotonic() < expires_at:
+                self._cache.move_to_end(user_id)  # LRU: 최근 사용으로 갱신
+                return user
+            self._cache.pop(user_id, None)
+
+        with self._db.session_scope(session) as session:
             user = session.query(User).filter(User.id == user_id).first()
             if user:
                 session.expunge(user)
-            return user
 
-    def get_by_username(self, username: str) -> Optional["User"]:
+        self._cache[user_id] = (user, time.monotonic() + _CACHE_TTL_SECONDS)
+        if len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        """캐시된 사용자 항목 무효화 (비활성화/정보 변경 시 호출)"""
+        self._cache.pop(user_id, None)
+
+    def get_by_username(self, username: str, session: Optional[Session] = None) -> Optional[User]:
         """사용자 이름으로 조회
 
         Args:
@@ -62,14 +92,13 @@ class UserRepository:
         Returns:
             User 엔티티 또는 None
         """
-        from src.domain.entities.user import User
-        with self._db.session_scope() as session:
+        with self._db.session_scope(session) as session:
             user = session.query(User).filter(User.username == username).first()
             if user:
                 session.expunge(user)
             return user
 
-    def exists(self, username: str) -> bool:
+    def exists(self, username: str, session: Optional[Session] = None) -> bool:
         """사용자 이름 존재 여부 확인
 
         Args:
@@ -78,6 +107,9 @@ class UserRepository:
         Returns:
             존재 여부
         """
-        from src.domain.entities.user import User
-        with self._db.session_scope() as session:
-            return session.query(User).filter(User.username == username).count() > 0
+        # COUNT(*)는 일치 행을 집계하지만 EXISTS는 첫 일치에서 단락 평가됨
+        # (username unique 인덱스로 인덱스 프로브 1회)
+        with self._db.session_scope(session) as session:
+            return session.query(
+                session.query(User).filter(User.username == username).exists()
+            ).scalar()
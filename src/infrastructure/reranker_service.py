@@ -4,6 +4,10 @@ Reranker Service - Infinity API 기반
 Infrastructure Layer: CrossEncoder 모델을 통한 문서 리랭킹
 GPU에서 서빙되는 Infinity API를 호출합니다.
 """
+import hashlib
+import heapq
+from collections import OrderedDict
+from operator import itemgetter
 from typing import List, Tuple, Optional
 
 import httpx
@@ -11,6 +15,15 @@ import httpx
 from src.core import Settings
 
 
+def content_digest(text: str) -> bytes:
+    """문서 내용의 8바이트 blake2b 다이제스트
+
+    캐시 키 등에서 문서 전문 대신 사용하는 짧은 식별자입니다.
+    검색 단계에서 1회 계산해 리랭커 캐시 등 하위 단계가 재사용합니다.
+    """
+    return hashlib.blake2b(text.encode(), digest_size=8).digest()
+
+
 class RerankerService:
     """Infinity 서버 기반 Reranker 서비스
 
@@ -26,6 +39,10 @@ class RerankerService:
         self.base_url = settings.reranker.base_url
         self.top_k = settings.reranker.top_k
         self._client: Optional[httpx.Client] = None
+        # (query, doc) 쌍별 Cross-Encoder 점수 LRU 캐시
+        # 후보 풀은 하루 단위로 안정적이고 질문은 반복되므로 재사용률이 높음
+        self._score_cache: "OrderedDict[Tuple[bytes, bytes], float]" = OrderedDict()
+        self._score_cache_maxsize = 50_000
 
     @property
     def client(self) -> httpx.Client:
@@ -33,7 +50,9 @@ class RerankerService:
         if self._client is None:
             self._client = httpx.Client(
                 base_url=self.base_url,
-                timeout=60.0
+                timeout=60.0,
+                # Keep-Alive 커넥션 재사용으로 요청마다 TCP 핸드셰이크 제거
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
             )
         return self._client
 
@@ -41,7 +60,8 @@ class RerankerService:
         self,
         query: str,
         documents: List[str],
-        top_k: Optional[int] = None
+        top_k: Optional[int] = None,
+        digests: Optional[List[bytes]] = None,
     ) -> List[Tuple[str, float]]:
         """문서 리랭킹
 
@@ -49,6 +69,8 @@ class RerankerService:
             query: 검색 쿼리
             documents: 리랭킹할 문서 리스트
             top_k: 반환할 상위 문서 수
+            digests: documents와 같은 순서의 content_digest 값
+                (검색 단계에서 이미 계산했다면 재해싱을 생략)
 
         Returns:
             (문서, 점수) 튜플 리스트 (점수 내림차순)
@@ -59,32 +81,89 @@ class RerankerService:
         if top_k is None:
             top_k = self.top_k
 
-        response = self.client.post(
-            "/rerank",
-            json={
-                "query": query,
-                "documents": documents,
-                "return_documents": True
-            }
-        )
-        response.raise_for_status()
-
-        results = response.json().get("results", [])
-        ranked = [
-            (r.get("document", {}).get("text", ""), r.get("relevance_score", 0.0))
-            for r in results
-        ]
+        # 문서별 다이제스트는 1회만 계산 (상위에서 넘겨주면 그것을 재사용)
+        if digests is None or len(digests) != len(documents):
+            digests = [content_digest(doc) for doc in documents]
+        digest_by_doc = dict(zip(documents, digests))
+
+        # 캐시 조회: 이미 점수가 있는 (query, doc) 쌍은 서버로 보내지 않음
+        query_digest = content_digest(query)
+        scores: dict = {}
+        missing: List[str] = []
+        for doc, doc_digest in zip(documents, digests):
+            cached = self._cache_get(query_digest, doc_digest)
+            if cached is not None:
+                scores[doc] = cached
+            else:
+                missing.append(doc)
+
+        if missing:
+            # 길이순 정렬 후 전송: Cross-Encoder는 배치 내 최장 문서 길이만큼
+            # 패딩되므로, 비슷한 길이끼리 묶이면 서버 측 연산 낭비가 줄어듭니다.
+            ordered_docs = sorted(missing, key=len)
+
+            response = self.client.post(
+                "/rerank",
+                json={
+                    "query": query,
+                    "documents": ordered_docs,
+                    "return_documents": True,
+                    # 미스난 문서 전부의 점수가 필요 (캐시 적재 + 병합 선별)
+                    "top_n": len(ordered_docs)
+                }
+            )
+            response.raise_for_status()
+
+            results = response.json().get("results", [])
+            for r in results:
+                doc = r.get("document", {}).get("text", "")
+                score = r.get("relevance_score", 0.0)
+                scores[doc] = score
+                doc_digest = digest_by_doc.get(doc) or content_digest(doc)
+                self._cache_put(query_digest, doc_digest, score)
+
+        # 캐시 점수와 신규 점수를 병합해 상위 top_k 선별
+        # (전체 정렬 O(N log N) 대신 O(N log k))
+        return heapq.nlargest(top_k, scores.items(), key=itemgetter(1))
+
+    def _cache_get(self, query_digest: bytes, doc_digest: bytes) -> Optional[float]:
+        """(query, doc) 쌍의 캐시된 점수 조회 (히트 시 최근 사용으로 갱신)"""
+        key = (query_digest, doc_digest)
+        score = self._score_cache.get(key)
+        if score is not None:
+            self._score_cache.move_to_end(key)
+        return score
+
+    def _cache_put(self, query_digest: bytes, doc_digest: bytes, score: float) -> None:
+        """(query, doc) 쌍의 점수 저장 (LRU 퇴출)"""
+        self._score_cache[(query_digest, doc_digest)] = score
+        if len(self._score_cache) > self._score_cache_maxsize:
+            self._score_cache.popitem(last=False)
+
+    def warmup(self) -> bool:
+        """리랭커 워밍업
+
+        서버 기동 시 호출하여 첫 실제 요청이 커넥션 수립과
+        서버 측 모델 로드/JIT 비용을 지불하지 않도록 합니다.
 
-        return ranked[:top_k]
+        Returns:
+            워밍업 성공 여부
+        """
+        try:
+            self.rerank("warmup", ["warmup document"], top_k=1)
+            return True
+        except Exception:
+            return False
 
     def get_top_documents(
         self,
         query: str,
         documents: List[str],
-        top_k: Optional[int] = None
+        top_k: Optional[int] = None,
+        digests: Optional[List[bytes]] = None,
     ) -> List[Tuple[str, float]]:
         """상위 문서 반환 (rerank의 별칭)"""
-        return self.rerank(query, documents, top_k)
+        return self.rerank(query, documents, top_k, digests=digests)
 
     def close(self):
         """HTTP 클라이언트 종료"""
@@ -6,18 +6,21 @@ Dense (OpenAI) + Sparse (BM25) Hybrid Search를 수행합니다.
 """
 import time
 import uuid
-from typing import TYPE_CHECKING, List, Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from langchain_openai import OpenAIEmbeddings
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    Fusion,
+    FusionQuery,
     MatchValue,
     PointStruct,
     Prefetch,
-    Query,
     SparseVectorParams,
     VectorParams,
 )
@@ -28,6 +31,7 @@ from .bm25_service import BM25Service
 
 if TYPE_CHECKING:
     from src.domain.entities import Chunk
+    from .cache_service import CacheService
 
 logger = get_logger(__name__)
 
@@ -47,11 +51,16 @@ class VectorStoreService:
         https://qdrant.tech/articles/hybrid-search/
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, cache_service: Optional["CacheService"] = None):
         self.settings = settings
         self._client: Optional[QdrantClient] = None
+        self._aclient: Optional[AsyncQdrantClient] = None
         self._embeddings: Optional[OpenAIEmbeddings] = None
         self._bm25: Optional[BM25Service] = None
+        self._cache_service = cache_service
+        # 쿼리 임베딩 LRU: 동일 쿼리 재검색 시 OpenAI 왕복 생략
+        self._query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_embedding_cache_maxsize = 10_000
 
     @property
     def client(self) -> QdrantClient:
@@ -63,6 +72,20 @@ class VectorStoreService:
             )
         return self._client
 
+    @property
+    def aclient(self) -> AsyncQdrantClient:
+        """비동기 Qdrant 클라이언트 (Lazy Loading)
+
+        이벤트 루프 위의 호출자(SSE, 비동기 평가 등)가 스레드풀을 거치지
+        않고 검색할 수 있도록 합니다.
+        """
+        if self._aclient is None:
+            self._aclient = AsyncQdrantClient(
+                host=self.settings.vectorstore.host,
+                port=self.settings.vectorstore.port,
+            )
+        return self._aclient
+
     @property
     def embeddings(self) -> OpenAIEmbeddings:
         """OpenAI Embeddings (Lazy Loading)"""
@@ -79,6 +102,22 @@ class VectorStoreService:
             self._bm25 = BM25Service()
         return self._bm25
 
+    def warmup(self) -> bool:
+        """임베더 워밍업
+
+        Lazy Loading되는 임베딩 클라이언트와 BM25 모델을 미리 로드하여
+        첫 검색 요청이 모델 로드 비용을 지불하지 않도록 합니다.
+
+        Returns:
+            워밍업 성공 여부
+        """
+        try:
+            _ = self.embeddings  # OpenAI 클라이언트 초기화
+            self.bm25.encode_query("warmup")  # FastEmbed 모델 로드
+            return True
+        except Exception:
+            return False
+
     def is_ready(self) -> bool:
         """Qdrant 서버 연결 확인"""
         try:
@@ -93,6 +132,12 @@ class VectorStoreService:
             self._client.close()
             self._client = None
 
+    async def aclose(self) -> None:
+        """비동기 클라이언트 종료"""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+
     def collection_exists(self) -> bool:
         """컬렉션 존재 여부 확인"""
         collections = self.client.get_collections().collections
@@ -131,17 +176,18 @@ class VectorStoreService:
 
         # Dense vectors (OpenAI)
         logger.debug("[VectorStore] Dense 임베딩 생성 중...")
-        dense_vectors = self.embeddings.embed_documents(texts)
+        dense_vectors = self._embed_documents_cached(texts)
 
         # Sparse vectors (BM25)
         logger.debug("[VectorStore] Sparse 벡터 생성 중...")
         sparse_vectors = self.bm25.encode(texts)
 
-        # Points 생성
+        # Points 생성 (저장 시각은 배치당 1회만 포맷)
+        now_iso = datetime.now().isoformat()
         points = []
         for chunk, dense_vec, sparse_vec in zip(chunks, dense_vectors, sparse_vectors):
             point_id = str(uuid.uuid4())
-            payload = chunk.to_qdrant_payload()
+            payload = chunk.to_qdrant_payload(now_iso)
 
             points.append(
                 PointStruct(
@@ -163,6 +209,52 @@ class VectorStoreService:
         logger.info("[VectorStore] %d개 청크 저장 완료 (%.1fms)", len(points), elapsed_ms)
         return len(points)
 
+    def _embed_documents_cached(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 생성 (해시 기반 캐시 + 배치 내 중복 제거)
+
+        재수집(re-ingest) 시 동일 텍스트의 임베딩 API 호출을 생략합니다.
+        캐시 서비스가 없으면 기존 경로로 동작합니다.
+        """
+        if self._cache_service is None:
+            return self.embeddings.embed_documents(texts)
+
+        model = self.settings.embedding.model
+        cached = self._cache_service.mget_embeddings(model, texts)
+
+        # 캐시 미스 텍스트만 중복 제거 후 임베딩
+        missing_unique = list(dict.fromkeys(
+            text for text, vec in zip(texts, cached) if vec is None
+        ))
+        if missing_unique:
+            logger.debug("[VectorStore] 임베딩 캐시 미스: %d/%d개", len(missing_unique), len(texts))
+            new_vectors = self.embeddings.embed_documents(missing_unique)
+            self._cache_service.mset_embeddings(model, missing_unique, new_vectors)
+            new_by_text = dict(zip(missing_unique, new_vectors))
+        else:
+            new_by_text = {}
+
+        return [
+            vec if vec is not None else new_by_text[text]
+            for text, vec in zip(texts, cached)
+        ]
+
+    def _embed_query_cached(self, query: str) -> List[float]:
+        """쿼리 임베딩 생성 (인프로세스 LRU 캐시)
+
+        같은 쿼리가 재검색되면 임베딩 API 왕복(~수백 ms)을 생략합니다.
+        문서 임베딩과 달리 쿼리는 짧고 반복 빈도가 높아 메모리 비용이 작습니다.
+        """
+        cached = self._query_embedding_cache.get(query)
+        if cached is not None:
+            self._query_embedding_cache.move_to_end(query)
+            return cached
+
+        vector = self.embeddings.embed_query(query)
+        self._query_embedding_cache[query] = vector
+        if len(self._query_embedding_cache) > self._query_embedding_cache_maxsize:
+            self._query_embedding_cache.popitem(last=False)
+        return vector
+
     def get_document_count(self) -> int:
         """저장된 문서(청크) 수 조회"""
         if not self.collection_exists():
@@ -180,14 +272,35 @@ class VectorStoreService:
         Returns:
             검색된 문서 내용 리스트
         """
+        return [content for _, content in self.hybrid_search_with_ids(query, limit)]
+
+    def hybrid_search_with_ids(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
+    ) -> List[Tuple[str, str]]:
+        """Hybrid Search (Dense + BM25) with RRF Fusion - Point ID 포함
+
+        호출 측에서 문서 전문 대신 Point ID로 중복 제거할 수 있도록
+        (point_id, content) 튜플을 반환합니다.
+
+        Args:
+            query: 검색 쿼리
+            limit: 반환할 결과 수
+            query_vector: 미리 계산된 Dense 쿼리 벡터 (없으면 직접 임베딩)
+
+        Returns:
+            (Point ID, 문서 내용) 튜플 리스트
+        """
         if limit is None:
             limit = self.settings.retriever.initial_limit
 
         logger.debug("[VectorStore] Hybrid Search 시작: %s", query[:50])
         start_time = time.time()
 
-        # 쿼리 벡터 생성
-        dense_query = self.embeddings.embed_query(query)
+        # 쿼리 벡터 생성 (일괄 임베딩된 벡터가 있으면 API 호출 생략)
+        dense_query = query_vector if query_vector is not None else self._embed_query_cached(query)
         sparse_query = self.bm25.encode_query(query)
 
         # Hybrid Search with Prefetch + RRF
@@ -205,7 +318,7 @@ class VectorStoreService:
                     limit=limit
                 )
             ],
-            query=Query(fusion="rrf"),
+            query=FusionQuery(fusion=Fusion.RRF),
             limit=limit
         )
 
@@ -213,7 +326,71 @@ class VectorStoreService:
         logger.info("[VectorStore] Hybrid Search 완료: %d개 결과 (%.1fms)",
                    len(results.points), elapsed_ms)
 
-        return [point.payload.get("content", "") for point in results.points]
+        return [
+            (str(point.id), self._truncate(point.payload.get("content", "")))
+            for point in results.points
+        ]
+
+    def _truncate(self, content: str) -> str:
+        """검색 결과 content 길이 상한 적용
+
+        max_content_chars > 0이면 상한을 넘는 문서만 새 문자열을 만들고,
+        그 외에는 원본을 그대로 반환합니다. 상한을 걸면 리랭커 요청
+        페이로드와 하위 단계(RAGAS Dataset 복사 등)의 바이트 이동량이
+        줄어듭니다. 기본값 0은 잘라내지 않음 (생성 품질 우선).
+        """
+        max_chars = self.settings.retriever.max_content_chars
+        if max_chars > 0 and len(content) > max_chars:
+            return content[:max_chars]
+        return content
+
+    async def ahybrid_search_with_ids(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
+    ) -> List[Tuple[str, str]]:
+        """hybrid_search_with_ids의 비동기 버전
+
+        asyncio.gather로 여러 쿼리를 동시에 팬아웃할 수 있습니다.
+        임베딩/검색 모두 네이티브 비동기 클라이언트를 사용하므로
+        스레드풀 워커를 점유하지 않습니다.
+        """
+        if limit is None:
+            limit = self.settings.retriever.initial_limit
+
+        logger.debug("[VectorStore] Hybrid Search(async) 시작: %s", query[:50])
+        start_time = time.time()
+
+        dense_query = query_vector if query_vector is not None else await self.embeddings.aembed_query(query)
+        sparse_query = self.bm25.encode_query(query)
+
+        results = await self.aclient.query_points(
+            collection_name=self.settings.vectorstore.collection_name,
+            prefetch=[
+                Prefetch(
+                    query=dense_query,
+                    using=self.settings.vectorstore.dense_vector_name,
+                    limit=limit
+                ),
+                Prefetch(
+                    query=sparse_query,
+                    using=self.settings.vectorstore.sparse_vector_name,
+                    limit=limit
+                )
+            ],
+            query=FusionQuery(fusion=Fusion.RRF),
+            limit=limit
+        )
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.info("[VectorStore] Hybrid Search(async) 완료: %d개 결과 (%.1fms)",
+                   len(results.points), elapsed_ms)
+
+        return [
+            (str(point.id), self._truncate(point.payload.get("content", "")))
+            for point in results.points
+        ]
 
     def search_by_file(self, file_name: str, limit: int = 100) -> List[str]:
         """특정 파일에서 검색"""
@@ -3,9 +3,12 @@ FastAPI Dependencies
 
 Presentation Layer: 의존성 주입 및 생명주기 관리
 """
+import asyncio
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
@@ -37,6 +40,17 @@ class RAGAppManager:
         load_dotenv()
         cls._instance = RAGApplication(settings)
         cls._instance.initialize(create_collection=False)
+
+        # 워밍업: 첫 요청이 모델 로드/커넥션 수립 비용을 지불하지 않도록
+        if cls._instance.vectorstore.warmup():
+            print("✅ 임베더 워밍업 완료")
+        else:
+            print("⚠️ 임베더 워밍업 실패 (첫 요청 시 로드)")
+        if cls._instance._reranker_service.warmup():
+            print("✅ Reranker 워밍업 완료")
+        else:
+            print("⚠️ Reranker 워밍업 실패 (첫 요청 시 연결)")
+
         return cls._instance
 
     @classmethod
@@ -51,6 +65,30 @@ def get_rag_app():
     return RAGAppManager.get_instance()
 
 
+def get_db_session(rag_app=Depends(get_rag_app)):
+    """요청 범위 DB 세션 의존성
+
+    한 핸들러에서 Repository 호출이 여러 번 일어날 때, 각 호출이
+    세션 체크아웃 + BEGIN/COMMIT을 반복하지 않도록 요청당 세션 1개를
+    주입합니다. Repository 메서드의 session 인자로 전달하면 커밋/종료는
+    여기서 요청 끝에 1회 수행됩니다.
+
+    Usage:
+        def handler(session: Session = Depends(get_db_session), ...):
+            items = app.conversation_repo.get_by_user(uid, session=session)
+            total = app.conversation_repo.count_by_user(uid, session=session)
+    """
+    session = rag_app.database_service.get_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 class TaskStatus:
     """업로드 작업 상태"""
     def __init__(self, task_id: str, file_name: str):
@@ -63,34 +101,132 @@ class TaskStatus:
 
 
 class TaskStore:
-    """업로드 작업 저장소 (메모리 기반)"""
-    _tasks: Dict[str, TaskStatus] = {}
+    """업로드 작업 저장소 (Redis Hash 기반)
+
+    멀티 워커(uvicorn --workers N)에서도 모든 워커가 동일한 작업 상태를
+    보도록 Redis Hash에 저장합니다. (TTL 24시간)
+    Redis를 사용할 수 없으면 인메모리 dict로 폴백합니다 (단일 워커 한정).
+    폴백도 Redis와 동일한 TTL로 만료 항목을 퇴출하여 무한히 자라지 않음.
+    """
+    TTL_SECONDS = 86400
+    _tasks: Dict[str, Tuple[TaskStatus, float]] = {}  # Redis 불가 시 폴백: (작업, 만료 시각)
+
+    @staticmethod
+    def _cache():
+        try:
+            return RAGAppManager.get_instance().cache_service
+        except RuntimeError:
+            return None
+
+    @classmethod
+    def _prune_fallback(cls) -> None:
+        """폴백 dict의 만료 항목 제거 (생성 시점마다 1회)"""
+        now = time.monotonic()
+        expired = [task_id for task_id, (_, expires_at) in cls._tasks.items() if expires_at <= now]
+        for task_id in expired:
+            cls._tasks.pop(task_id, None)
+
+    @staticmethod
+    def _to_mapping(task: TaskStatus) -> Dict[str, str]:
+        mapping = {
+            "task_id": task.task_id,
+            "file_name": task.file_name,
+            "status": task.status,
+        }
+        if task.chunks_created is not None:
+            mapping["chunks_created"] = str(task.chunks_created)
+        if task.error is not None:
+            mapping["error"] = task.error
+        if task.completed_at is not None:
+            mapping["completed_at"] = task.completed_at.isoformat()
+        return mapping
+
+    @staticmethod
+    def _from_mapping(data: Dict[str, str]) -> TaskStatus:
+        task = TaskStatus(data["task_id"], data.get("file_name", ""))
+        task.status = data.get("status", "pending")
+        if "chunks_created" in data:
+            task.chunks_created = int(data["chunks_created"])
+        task.error = data.get("error")
+        if "completed_at" in data:
+            task.completed_at = datetime.fromisoformat(data["completed_at"])
+        return task
 
     @classmethod
     def create_task(cls, file_name: str) -> str:
         task_id = str(uuid.uuid4())
-        cls._tasks[task_id] = TaskStatus(task_id, file_name)
+        task = TaskStatus(task_id, file_name)
+
+        cache = cls._cache()
+        if cache is None or not cache.set_task(task_id, cls._to_mapping(task), cls.TTL_SECONDS):
+            cls._prune_fallback()
+            cls._tasks[task_id] = (task, time.monotonic() + cls.TTL_SECONDS)
         return task_id
 
     @classmethod
     def get_task(cls, task_id: str) -> Optional[TaskStatus]:
-        return cls._tasks.get(task_id)
+        cache = cls._cache()
+        if cache is not None:
+            data = cache.get_task(task_id)
+            if data:
+                return cls._from_mapping(data)
+        entry = cls._tasks.get(task_id)
+        if entry is None:
+            return None
+        task, expires_at = entry
+        if time.monotonic() >= expires_at:
+            cls._tasks.pop(task_id, None)
+            return None
+        return task
 
     @classmethod
     def update_task(cls, task_id: str, **kwargs) -> None:
-        if task_id in cls._tasks:
+        mapping = {}
+        for k, v in kwargs.items():
+            if v is None:
+                continue
+            mapping[k] = v.isoformat() if isinstance(v, datetime) else str(v)
+
+        cache = cls._cache()
+        if cache is not None and mapping and cache.update_task(task_id, mapping):
+            return
+
+        entry = cls._tasks.get(task_id)
+        if entry is not None:
             for k, v in kwargs.items():
-                setattr(cls._tasks[task_id], k, v)
+                setattr(entry[0], k, v)
+
+
+# 파일 수집(ingest) 전용 실행기
+# FastAPI의 공용 스레드풀(동기 의존성/엔드포인트용)과 분리하여,
+# 업로드 처리가 /query 요청의 스레드를 빼앗지 않도록 합니다.
+_ingest_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_ingest_executor() -> ThreadPoolExecutor:
+    """수집 작업 전용 스레드풀"""
+    global _ingest_executor
+    if _ingest_executor is None:
+        _ingest_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ingest")
+    return _ingest_executor
 
 
 @asynccontextmanager
 async def lifespan(app):
     """FastAPI 생명주기 관리"""
     print("=== RAG API Server Starting ===")
-    RAGAppManager.initialize()
+    app_instance = RAGAppManager.initialize()
+    # 리랭킹 병합 큐를 서버 이벤트 루프에 바인딩: 동기 노드(워커 스레드)의
+    # rerank_sync 호출이 이 루프로 제출되어 동시 요청이 coalesce됨
+    app_instance.batched_reranker.bind_loop(asyncio.get_running_loop())
+    get_ingest_executor()
     print("=== RAGApplication Initialized ===")
     yield
     print("=== RAG API Server Shutting Down ===")
+    global _ingest_executor
+    if _ingest_executor is not None:
+        _ingest_executor.shutdown(wait=False)
+        _ingest_executor = None
     RAGAppManager.shutdown()
 
 
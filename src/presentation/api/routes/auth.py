@@ -7,6 +7,7 @@ Presentation Layer: 인증 관련 API 엔드포인트
 - GET /api/v1/auth/me: 현재 사용자 정보
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 
 from src.presentation.dto.schemas import (
     RegisterRequest,
@@ -15,7 +16,7 @@ from src.presentation.dto.schemas import (
     UserResponse,
     ErrorResponse
 )
-from src.presentation.api.dependencies import get_rag_app, get_current_user
+from src.presentation.api.dependencies import get_rag_app, get_current_user, get_db_session
 from src.domain.entities import User
 
 
@@ -30,13 +31,19 @@ router = APIRouter(prefix="/auth", tags=["auth"])
         400: {"model": ErrorResponse, "description": "이미 존재하는 사용자"},
     }
 )
-async def register(request: RegisterRequest, app=Depends(get_rag_app)):
+async def register(
+    request: RegisterRequest,
+    app=Depends(get_rag_app),
+    session: Session = Depends(get_db_session),
+):
     """회원가입
 
     새 사용자를 등록하고 JWT 토큰을 반환합니다.
+    중복 확인과 생성이 요청 범위 세션 1개를 공유합니다
+    (커넥션 체크아웃 + BEGIN/COMMIT 1회).
     """
     # 사용자 이름 중복 확인
-    if app.user_repo.exists(request.username):
+    if app.user_repo.exists(request.username, session=session):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 존재하는 사용자 이름입니다."
@@ -44,7 +51,7 @@ async def register(request: RegisterRequest, app=Depends(get_rag_app)):
 
     # 비밀번호 해시 및 사용자 생성
     password_hash = app.auth_service.hash_password(request.password)
-    user = app.user_repo.create(request.username, password_hash)
+    user = app.user_repo.create(request.username, password_hash, session=session)
 
     # JWT 토큰 생성
     token = app.auth_service.create_access_token(user.id, user.username)
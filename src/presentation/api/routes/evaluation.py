@@ -10,12 +10,12 @@ Presentation Layer: RAG 평가 API
 - POST /api/v1/eval/export: 결과 내보내기
 """
 
-import json
 import csv
 import io
 from datetime import datetime
 from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -157,7 +157,7 @@ async def evaluate_batch(
             include_generation_metrics=request.include_generation_metrics,
         )
 
-        result = runner.evaluate_batch(batch_request)
+        result = await runner.aevaluate_batch(batch_request)
 
         logger.info("[Eval] 배치 평가 완료: %d개 완료, avg_latency=%.1fms",
                    result.aggregated.total_samples,
@@ -215,7 +215,8 @@ async def export_json(results: List[EvaluationResult]):
     filename = f"eval_results_{timestamp}.json"
 
     data = [r.model_dump() for r in results]
-    content = json.dumps(data, ensure_ascii=False, indent=2)
+    # orjson: datetime/UUID를 C 레벨에서 직렬화 (stdlib json + 커스텀 인코더 대비 수 배 빠름)
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
     return Response(
         content=content,
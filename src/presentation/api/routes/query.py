@@ -6,10 +6,12 @@ Presentation Layer: 질문 처리 API
 - RAG 파이프라인 실행
 - 결과 캐싱 및 DB 저장
 """
+import json
 import time
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.core.logging import get_logger
 from src.presentation.dto import QueryRequest, QueryResponse, SourceDocument, ErrorResponse
@@ -38,32 +40,32 @@ async def query(
     start = time.time()
 
     try:
-        # 1. 캐시 확인
-        cached = rag_app.cache_service.get_cached_response(request.question)
+        # 1. 캐시 확인 (비동기 클라이언트: Redis 왕복 동안 루프 논블로킹)
+        cached = await rag_app.cache_service.aget_cached_response(request.question)
         if cached:
             # 캐시 히트 - DB에는 저장하지 않음 (이미 저장됨)
             logger.info("[Query] 캐시 히트 - 즉시 반환")
             return QueryResponse(
                 answer=cached["answer"],
-                sources=[SourceDocument(**s) for s in cached.get("sources", [])],
+                sources=[SourceDocument.model_construct(**s) for s in cached.get("sources", [])],
                 processing_time_ms=cached.get("processing_time_ms", 0),
                 cached=True
             )
 
-        # 2. RAG 파이프라인 실행
-        result = rag_app._workflow.invoke(request.question)
+        # 2. RAG 파이프라인 실행 (이벤트 루프를 막지 않도록 비동기 실행)
+        result = await rag_app._workflow.ainvoke(request.question)
 
-        # 출처 문서 정리
+        # 출처 문서 정리 (content는 이미 신뢰할 수 있는 str이므로 검증 생략)
         sources = [
-            SourceDocument(content=doc[:500] + "..." if len(doc) > 500 else doc)
-            for doc in result.get("retrieved_docs", [])[:5]
+            SourceDocument.model_construct(content=(doc[:500] + "...") if len(doc) > 500 else doc)
+            for doc in result.get("retrieved_docs", ())[:5]
         ]
 
         processing_time_ms = round((time.time() - start) * 1000, 2)
         answer = result["final_answer"]
 
         # 3. 캐시 저장
-        rag_app.cache_service.cache_response(
+        await rag_app.cache_service.acache_response(
             question=request.question,
             answer=answer,
             sources=[s.model_dump() for s in sources],
@@ -99,3 +101,32 @@ async def query(
     except Exception as e:
         logger.error("[Query] 처리 실패: %s", str(e), exc_info=True)
         raise HTTPException(status_code=500, detail={"error": "QueryProcessingError", "message": str(e)})
+
+
+@router.post("/query/stream")
+async def query_stream(request: QueryRequest, rag_app=Depends(get_rag_app)):
+    """질문에 대한 답변 생성 (SSE 토큰 스트리밍)
+
+    생성 LLM의 토큰을 Server-Sent Events로 즉시 전달하여
+    첫 토큰까지의 체감 지연을 줄입니다.
+    한 번에 전체 JSON이 필요한 클라이언트는 /query를 사용하세요.
+    """
+    logger.info("[Query] 스트리밍 요청 수신: %s", request.question[:50])
+
+    async def event_generator():
+        try:
+            async for token in rag_app._workflow.astream(request.question):
+                yield f"data: {json.dumps({'delta': token}, ensure_ascii=False)}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            logger.error("[Query] 스트리밍 실패: %s", str(e), exc_info=True)
+            yield f"data: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Nginx 버퍼링 방지
+        },
+    )
@@ -6,17 +6,23 @@ Presentation Layer: 파일 업로드 API
 - 캐시 무효화 (Redis)
 - 문서 메타데이터 DB 저장
 """
+import asyncio
 import os
 import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 
 from src.core.logging import get_logger
 from src.presentation.dto import UploadResponse, UploadStatusResponse, UploadStatus, ErrorResponse
-from src.presentation.api.dependencies import get_rag_app, get_current_user_optional, TaskStore
+from src.presentation.api.dependencies import (
+    get_rag_app,
+    get_current_user_optional,
+    get_ingest_executor,
+    TaskStore,
+)
 from src.domain.entities import User
 
 logger = get_logger(__name__)
@@ -122,7 +128,6 @@ def process_file_task(
 
 @router.post("/upload", response_model=UploadResponse, responses={400: {"model": ErrorResponse}})
 async def upload_file(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     rag_app=Depends(get_rag_app),
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -149,8 +154,13 @@ async def upload_file(
     logger.debug("[Upload] 작업 생성: task_id=%s", task_id)
 
     # user_id 전달 (인증된 사용자만)
+    # BackgroundTasks 대신 전용 스레드풀에 제출하여
+    # FastAPI 공용 스레드풀(/query 등)을 막지 않음
     user_id = current_user.id if current_user else None
-    background_tasks.add_task(process_file_task, task_id, str(file_path), rag_app, user_id)
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(
+        get_ingest_executor(), process_file_task, task_id, str(file_path), rag_app, user_id
+    )
 
     logger.info("[Upload] 백그라운드 작업 시작: %s (task=%s)", file.filename, task_id)
     return UploadResponse(
@@ -42,6 +42,11 @@ def mock_vectorstore_service():
     mock.collection_exists.return_value = True
     mock.get_document_count.return_value = 100
     mock.hybrid_search.return_value = ["doc1 content", "doc2 content", "doc3 content"]
+    mock.hybrid_search_with_ids.return_value = [
+        ("id1", "doc1 content"),
+        ("id2", "doc2 content"),
+        ("id3", "doc3 content"),
+    ]
     mock.add_chunks.return_value = 10
     return mock
 
@@ -104,8 +109,10 @@ class SampleChunk:
     def char_count(self) -> int:
         return len(self.content)
 
-    def to_qdrant_payload(self):
+    def to_qdrant_payload(self, now_iso=None):
         from datetime import datetime
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
         return {
             "content": self.content,
             "chunk_id": self.chunk_id,
@@ -118,7 +125,7 @@ class SampleChunk:
             "char_count": self.char_count,
             "page_number": self.metadata.get("page_number"),
             "sheet_name": self.metadata.get("sheet_name"),
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
         }
 
 
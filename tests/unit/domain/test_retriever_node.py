@@ -13,12 +13,12 @@ class TestRetrieverNode:
     @pytest.fixture
     def retriever_node(self, mock_vectorstore_service, mock_reranker_service):
         """RetrieverNode with mocks"""
-        mock_vectorstore_service.hybrid_search.return_value = [
-            "Document 1 content about RAG",
-            "Document 2 content about search",
-            "Document 3 content about generation",
-            "Document 4 content about vectors",
-            "Document 5 content about embeddings",
+        mock_vectorstore_service.hybrid_search_with_ids.return_value = [
+            ("id1", "Document 1 content about RAG"),
+            ("id2", "Document 2 content about search"),
+            ("id3", "Document 3 content about generation"),
+            ("id4", "Document 4 content about vectors"),
+            ("id5", "Document 5 content about embeddings"),
         ]
         # get_top_documents returns List[Tuple[str, float]]
         mock_reranker_service.get_top_documents.return_value = [
@@ -45,7 +45,7 @@ class TestRetrieverNode:
         """Hybrid Search를 사용하여 검색"""
         retriever_node(rag_state_after_rewrite)
 
-        mock_vectorstore_service.hybrid_search.assert_called()
+        mock_vectorstore_service.hybrid_search_with_ids.assert_called()
 
     def test_call_uses_reranker(self, retriever_node, rag_state_after_rewrite, mock_reranker_service):
         """Reranker를 사용하여 문서 재정렬"""
@@ -59,7 +59,7 @@ class TestRetrieverNode:
         retriever_node(rag_state_after_rewrite)
 
         # 각 쿼리에 대해 hybrid_search 호출
-        assert mock_vectorstore_service.hybrid_search.call_count == num_queries
+        assert mock_vectorstore_service.hybrid_search_with_ids.call_count == num_queries
 
     def test_returns_reranked_documents(self, retriever_node, rag_state_after_rewrite, mock_reranker_service):
         """Reranking된 문서 반환"""
@@ -88,10 +88,10 @@ class TestRetrieverNode:
     def test_deduplicates_search_results(self, retriever_node, mock_vectorstore_service, rag_state_after_rewrite):
         """중복 검색 결과 제거"""
         # 동일한 문서가 여러 쿼리에서 반환되는 경우
-        mock_vectorstore_service.hybrid_search.return_value = [
-            "Duplicate document",
-            "Duplicate document",  # 중복
-            "Unique document",
+        mock_vectorstore_service.hybrid_search_with_ids.return_value = [
+            ("dup-id", "Duplicate document"),
+            ("dup-id", "Duplicate document"),  # 중복 (동일 Point ID)
+            ("unique-id", "Unique document"),
         ]
 
         result = retriever_node(rag_state_after_rewrite)
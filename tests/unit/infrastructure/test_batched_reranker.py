@@ -0,0 +1,76 @@
+"""
+BatchedReranker Unit Tests
+
+리랭킹 요청 병합(Request Coalescing) 래퍼의 단위 테스트
+"""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.config import Settings
+from src.infrastructure.batched_reranker import BatchedReranker
+
+
+class TestBatchedReranker:
+    """BatchedReranker 테스트"""
+
+    @pytest.fixture
+    def mock_reranker(self):
+        """RerankerService mock (문서 순서대로 동점 반환)"""
+        mock = MagicMock()
+        mock.top_k = 5
+        mock.rerank.side_effect = (
+            lambda query, docs, top_k=None, **kwargs: [(doc, 1.0) for doc in docs]
+        )
+        return mock
+
+    @pytest.fixture
+    def batched(self, mock_reranker):
+        settings = Settings()
+        settings.reranker.coalesce_window_ms = 50.0
+        return BatchedReranker(mock_reranker, settings)
+
+    def test_concurrent_requests_share_one_upstream_call(self, batched, mock_reranker):
+        """같은 쿼리의 동시 요청은 업스트림 호출 1회로 병합"""
+        async def main():
+            return await asyncio.gather(
+                batched.rerank("질문", ["a", "b"]),
+                batched.rerank("질문", ["b", "c"]),
+            )
+
+        first, second = asyncio.run(main())
+
+        mock_reranker.rerank.assert_called_once()
+        merged_docs = mock_reranker.rerank.call_args.args[1]
+        assert merged_docs == ["a", "b", "c"]  # 중복 제거 + 순서 유지
+        # 각 요청은 자기 문서만 돌려받음
+        assert [doc for doc, _ in first] == ["a", "b"]
+        assert [doc for doc, _ in second] == ["b", "c"]
+
+    def test_rerank_sync_coalesces_via_bound_loop(self, batched, mock_reranker):
+        """워커 스레드의 rerank_sync도 바인딩된 루프에서 병합됨"""
+        async def main():
+            batched.bind_loop(asyncio.get_running_loop())
+            return await asyncio.gather(
+                asyncio.to_thread(batched.rerank_sync, "질문", ["a", "b"]),
+                asyncio.to_thread(batched.rerank_sync, "질문", ["b", "c"]),
+            )
+
+        first, second = asyncio.run(main())
+
+        mock_reranker.rerank.assert_called_once()
+        assert [doc for doc, _ in first] == ["a", "b"]
+        assert [doc for doc, _ in second] == ["b", "c"]
+
+    def test_rerank_sync_falls_back_without_loop(self, batched, mock_reranker):
+        """루프 미바인딩(CLI 등) 시 RerankerService 직접 호출로 폴백"""
+        result = batched.rerank_sync("질문", ["a"], digests=None)
+
+        mock_reranker.rerank.assert_called_once_with("질문", ["a"], None, digests=None)
+        assert [doc for doc, _ in result] == ["a"]
+
+    def test_empty_documents_short_circuit(self, batched, mock_reranker):
+        """빈 문서 리스트는 업스트림 호출 없이 즉시 반환"""
+        assert asyncio.run(batched.rerank("질문", [])) == []
+        mock_reranker.rerank.assert_not_called()
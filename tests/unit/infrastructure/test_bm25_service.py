@@ -25,10 +25,12 @@ class TestBM25Service:
     @pytest.fixture
     def bm25_service(self, mock_sparse_embedding):
         """BM25Service with mocked SparseTextEmbedding"""
+        from src.infrastructure import bm25_service as bm25_module
+        # 모델 싱글턴 캐시 초기화 (테스트 간 mock 격리)
+        bm25_module._MODEL_CACHE.clear()
         with patch('src.infrastructure.bm25_service.SparseTextEmbedding') as mock_class:
             mock_class.return_value = mock_sparse_embedding
-            from src.infrastructure.bm25_service import BM25Service
-            service = BM25Service()
+            service = bm25_module.BM25Service()
             return service
 
     def test_encode_returns_sparse_vectors(self, bm25_service, mock_sparse_embedding):
@@ -58,10 +60,24 @@ class TestBM25Service:
         assert hasattr(result, 'indices')
         assert hasattr(result, 'values')
 
-    def test_encode_batch_processes_in_batches(self, bm25_service, mock_sparse_embedding):
-        """encode_batch가 배치 단위로 처리"""
+    def test_encode_batch_delegates_batching_to_fastembed(self, bm25_service, mock_sparse_embedding):
+        """encode_batch가 FastEmbed 내부 배칭에 위임 (단일 호출)"""
         texts = ["doc"] * 100
-        result = bm25_service.encode_batch(texts, batch_size=32)
+        bm25_service.encode_batch(texts, batch_size=32)
 
-        # 100개 텍스트, 32배치 = 4번 호출 (32, 32, 32, 4)
-        assert mock_sparse_embedding.embed.call_count == 4
+        # Python 슬라이싱 없이 전체 리스트를 1회 전달 (batch_size는 내부 배칭용)
+        mock_sparse_embedding.embed.assert_called_once_with(
+            texts, batch_size=32, parallel=0
+        )
+
+    def test_model_singleton_is_shared_per_model_name(self, mock_sparse_embedding):
+        """같은 model_name의 BM25Service 인스턴스는 모델을 공유"""
+        from src.infrastructure import bm25_service as bm25_module
+        bm25_module._MODEL_CACHE.clear()
+        with patch('src.infrastructure.bm25_service.SparseTextEmbedding') as mock_class:
+            mock_class.return_value = mock_sparse_embedding
+            first = bm25_module.BM25Service()
+            second = bm25_module.BM25Service()
+
+        assert first._model is second._model
+        mock_class.assert_called_once()
@@ -76,18 +76,22 @@ class TestCacheService:
         # 실제 코드는 setex 사용 (TTL 포함)
         mock_redis.setex.assert_called_once()
 
-    def test_invalidate_all_deletes_rag_keys(self, cache_service, mock_redis):
-        """invalidate_all이 RAG 캐시 키를 삭제"""
-        mock_redis.keys.return_value = [b"rag:query:abc", b"rag:query:def"]
-        mock_redis.delete.return_value = 2
+    def test_invalidate_all_unlinks_scanned_keys(self, cache_service, mock_redis):
+        """invalidate_all이 SCAN으로 찾은 키를 파이프라인 UNLINK로 삭제"""
+        mock_redis.scan_iter.return_value = iter([b"rag:query:abc", b"rag:query:def"])
+        mock_pipe = MagicMock()
+        mock_pipe.execute.return_value = [1, 1]
+        mock_redis.pipeline.return_value = mock_pipe
 
         result = cache_service.invalidate_all()
         assert result == 2
-        mock_redis.delete.assert_called_once()
+        mock_redis.scan_iter.assert_called_once_with(match="rag:query:*", count=500)
+        assert mock_pipe.unlink.call_count == 2
+        mock_pipe.execute.assert_called_once()
 
     def test_invalidate_all_returns_zero_when_no_keys(self, cache_service, mock_redis):
         """삭제할 키가 없으면 0 반환"""
-        mock_redis.keys.return_value = []
+        mock_redis.scan_iter.return_value = iter([])
 
         result = cache_service.invalidate_all()
         assert result == 0
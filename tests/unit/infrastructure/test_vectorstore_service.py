@@ -110,7 +110,7 @@ class TestVectorStoreService:
 
         mock_qdrant_client.query_points.return_value = MagicMock(points=[mock_point1, mock_point2])
 
-        with patch('src.infrastructure.vectorstore_service.Query') as mock_query, \
+        with patch('src.infrastructure.vectorstore_service.FusionQuery') as mock_query, \
              patch('src.infrastructure.vectorstore_service.Prefetch') as mock_prefetch:
             mock_query.return_value = MagicMock()
             mock_prefetch.return_value = MagicMock()
@@ -124,7 +124,7 @@ class TestVectorStoreService:
         """hybrid_search가 Qdrant query_points 호출"""
         mock_qdrant_client.query_points.return_value = MagicMock(points=[])
 
-        with patch('src.infrastructure.vectorstore_service.Query') as mock_query, \
+        with patch('src.infrastructure.vectorstore_service.FusionQuery') as mock_query, \
              patch('src.infrastructure.vectorstore_service.Prefetch') as mock_prefetch:
             mock_query.return_value = MagicMock()
             mock_prefetch.return_value = MagicMock()